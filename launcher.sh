@@ -1,20 +1,14 @@
 #!/usr/bin/env bash
 # Launcher script for Tower of Temptation Discord Bot
-# This script is executed by app.py to start the bot in Replit
-
-# Exit on error
-set -e
+# Replaces the shell with the bot process instead of running it as a child.
+# app.py applies the development defaults, installs dependencies on first run
+# and then runs run.py, which initializes the database, loads the cogs and
+# connects to Discord.
 
 echo "Tower of Temptation Discord Bot Launcher"
 echo "========================================"
 echo "Starting bot at $(date)"
 
-# Make sure the script is executable
-chmod +x run.py
-
 # Start the bot
 echo "Executing main bot script..."
-python3 run.py
-
-# If we get here, the bot has exited
-echo "Bot process has terminated at $(date)"
\ No newline at end of file
+exec python3 app.py
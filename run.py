@@ -9,19 +9,58 @@ and environment setup.
 import os
 import sys
 import asyncio
+import atexit
 import logging
-import traceback
+import logging.handlers
+import queue
+import threading
 from dotenv import load_dotenv
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("bot.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Use uvloop for the event loop when it is installed
+try:
+    import uvloop
+    loop_factory = uvloop.new_event_loop
+except ImportError:
+    loop_factory = None
+
+from utils.advanced_logging import RecordQueueHandler
+
+# Configure logging - records are only enqueued on the calling thread, the
+# listener thread formats and writes them to the console and bot.log
+log_queue = queue.SimpleQueue()
+log_listener = None
+
+def queue_root_handlers():
+    """Move the root logger's handlers behind a QueueListener thread"""
+    global log_listener
+    
+    root_logger = logging.getLogger()
+    handlers = [handler for handler in root_logger.handlers
+                if not isinstance(handler, logging.handlers.QueueHandler)]
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    
+    if log_listener is not None:
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            if handler not in handlers:
+                handler.close()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root_logger.addHandler(RecordQueueHandler(log_queue))
+    log_listener.start()
+
+log_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+log_handlers = [
+    logging.FileHandler("bot.log"),
+    logging.StreamHandler(sys.stdout)
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+logging.basicConfig(level=logging.INFO, handlers=log_handlers)
+queue_root_handlers()
+atexit.register(lambda: log_listener.stop())
 logger = logging.getLogger("bot.run")
 
 # Load environment variables from .env file if it exists
@@ -45,9 +84,12 @@ if not os.environ.get("MONGODB_URI"):
 # Import bot after environment variables are loaded
 try:
     from bot import Bot
+    from main import load_extensions
+    # Importing bot and main runs setup_logging(), which replaces the root handlers
+    queue_root_handlers()
     logger.info("Successfully imported Bot")
 except ImportError as e:
-    logger.error(f"Failed to import Bot: {e}")
+    logger.error("Failed to import Bot: %s", e)
     print(f"Error: Failed to import Bot: {e}")
     sys.exit(1)
 
@@ -56,31 +98,49 @@ async def main():
     
     logger.info("Initializing bot...")
     
+    # Development mode sets the bot up without connecting to Discord
+    dev_mode = os.environ.get("DISCORD_DEV_MODE", "false").lower() == "true"
+    
     # Initialize the bot
-    bot = Bot()
+    bot = Bot(production=not dev_mode)
     
-    # Register signal handlers for graceful shutdown
-    try:
-        import signal
-        
-        def handle_exit(sig, frame):
-            """Handle exit signals"""
-            logger.info(f"Received signal {sig}, shutting down...")
-            asyncio.create_task(bot.close())
-        
-        signal.signal(signal.SIGINT, handle_exit)
-        signal.signal(signal.SIGTERM, handle_exit)
-        logger.info("Registered signal handlers for graceful shutdown")
-    except (ImportError, NotImplementedError):
-        logger.warning("Could not register signal handlers")
+    # Register signal handlers for graceful shutdown - this is only allowed
+    # from the main thread, e.g. not when run.py is loaded by a reloader thread
+    if threading.current_thread() is threading.main_thread():
+        try:
+            import signal
+            
+            def handle_exit(sig, frame):
+                """Handle exit signals"""
+                logger.info("Received signal %s, shutting down...", sig)
+                asyncio.create_task(bot.close())
+            
+            signal.signal(signal.SIGINT, handle_exit)
+            signal.signal(signal.SIGTERM, handle_exit)
+            logger.info("Registered signal handlers for graceful shutdown")
+        except (ImportError, NotImplementedError):
+            logger.warning("Could not register signal handlers")
+    else:
+        logger.warning("Not running in the main thread, skipping signal handlers")
     
     # Start the bot
     try:
+        if not await bot.init_db():
+            logger.critical("Failed to initialize database. Bot cannot start!")
+            sys.exit(1)
+        
+        if not await load_extensions(bot):
+            logger.critical("Failed to load required extensions. Bot cannot start!")
+            sys.exit(1)
+        
+        if dev_mode:
+            logger.info("Bot initialized in DEVELOPMENT mode - not connecting to Discord API")
+            return
+        
         logger.info("Starting bot...")
         await bot.start(os.environ["DISCORD_TOKEN"])
     except Exception as e:
-        logger.error(f"Error starting bot: {e}")
-        traceback.print_exc()
+        logger.exception("Error starting bot: %s", e)
         sys.exit(1)
     finally:
         # Ensure bot is closed properly
@@ -89,13 +149,18 @@ async def main():
         
         logger.info("Bot has shut down")
 
-if __name__ == "__main__":
-    # Run the bot
+def run_bot():
+    """Run the bot until it shuts down"""
+    # Python 3.11+ is required, so asyncio.Runner is always available
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("Bot stopped by keyboard interrupt")
     except Exception as e:
-        logger.error(f"Unhandled exception: {e}")
-        traceback.print_exc()
-        sys.exit(1)
\ No newline at end of file
+        logger.exception("Unhandled exception: %s", e)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    # Run the bot
+    run_bot()
@@ -12,15 +12,6 @@ import importlib
 import traceback
 from typing import Optional, Dict, Any, List, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-
 logger = logging.getLogger("pycord_compatibility_test")
 
 # Results storage
@@ -31,6 +22,16 @@ test_results = {
     "compatibility_layer": {}
 }
 
+# Interaction attributes probed by test_interaction_features
+INTERACTION_ATTRS = frozenset({
+    "respond",
+    "response",
+    "followup",
+    "edit_original_message",
+    "edit_original_response",
+    "original_response",
+})
+
 class TestOutcome:
     """Simple class to track test results"""
     SUCCESS = "SUCCESS"
@@ -127,46 +128,28 @@ async def test_interaction_features():
     try:
         import discord
         
-        # Create a dummy interaction for testing
-        class MockInteraction:
-            def __init__(self):
-                self.response = None
-                self.followup = None
-                self._responded = False
-                self.user = None
-                self.channel = None
+        # Check only the attributes we care about on the real classes
+        interaction_class = discord.Interaction
+        present = {name for name in INTERACTION_ATTRS if hasattr(interaction_class, name)}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Interaction has: %s", sorted(present))
+        test_results["interaction_features"]["present_attrs"] = sorted(present)
         
         # Check for response attribute
-        interaction = MockInteraction()
-        has_response_attr = hasattr(interaction, "response")
-        logger.info(f"Interaction has 'response' attribute: {has_response_attr}")
+        has_response_attr = "response" in present
         test_results["interaction_features"]["has_response_attr"] = has_response_attr
         
         # Check for respond method and pattern
-        has_respond_method = hasattr(interaction, "respond") and callable(getattr(interaction, "respond", None))
-        logger.info(f"Interaction has 'respond' method: {has_respond_method}")
+        has_respond_method = "respond" in present and callable(interaction_class.respond)
         test_results["interaction_features"]["has_respond_method"] = has_respond_method
         
         # Check for followup attribute
-        has_followup_attr = hasattr(interaction, "followup")
-        logger.info(f"Interaction has 'followup' attribute: {has_followup_attr}")
+        has_followup_attr = "followup" in present
         test_results["interaction_features"]["has_followup_attr"] = has_followup_attr
         
-        # Create mock response object
-        class MockResponse:
-            def __init__(self):
-                self.is_done_called = False
-            
-            def is_done(self):
-                self.is_done_called = True
-                return False
-        
-        # Add response to interaction
-        interaction.response = MockResponse()
-        
         # Test for is_done method
-        has_is_done_method = hasattr(interaction.response, "is_done") and callable(interaction.response.is_done)
-        logger.info(f"Interaction.response has 'is_done' method: {has_is_done_method}")
+        has_is_done_method = callable(getattr(discord.InteractionResponse, "is_done", None))
+        logger.info("Interaction.response has 'is_done' method: %s", has_is_done_method)
         test_results["interaction_features"]["has_is_done_method"] = has_is_done_method
         
         # Based on the results, determine which library version's interaction pattern this likely is
@@ -383,6 +366,10 @@ async def test_compatibility_layer():
 
 async def print_summary():
     """Print a summary of all test results"""
+    # The summary is only logged at INFO, skip walking the results otherwise
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     logger.info("\n\n=== PY-CORD 2.6.1 COMPATIBILITY TEST SUMMARY ===\n")
     
     # Library detection
@@ -453,4 +440,13 @@ def main():
     logger.info("Compatibility tests complete")
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, never on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    
     main()
\ No newline at end of file
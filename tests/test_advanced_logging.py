@@ -0,0 +1,106 @@
+"""
+Tests for the logging filters and queue handler
+
+Run with pytest or directly: python tests/test_advanced_logging.py
+"""
+import logging
+import os
+import queue
+import sys
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from utils import advanced_logging
+from utils.advanced_logging import RateLimitedLogFilter, RecordQueueHandler
+
+
+def make_record(msg, *args, exc_info=None):
+    """Build a log record the way a logger call would"""
+    return logging.LogRecord("test", logging.ERROR, __file__, 1, msg, args, exc_info)
+
+
+def test_rate_limit_drops_repeats_after_the_limit():
+    """Identical messages pass up to the rate, then one summary, then nothing"""
+    log_filter = RateLimitedLogFilter(rate=2, period=60)
+    results = [log_filter.filter(make_record("disk %s full", "a")) for _ in range(5)]
+    
+    assert results == [True, True, True, False, False]
+
+
+def test_rate_limit_entries_expire_after_the_period():
+    """Messages that stopped repeating are forgotten by _expire"""
+    log_filter = RateLimitedLogFilter(rate=2, period=60)
+    log_filter.filter(make_record("old"))
+    now = log_filter.messages["old"][1]
+    log_filter.filter(make_record("recent"))
+    log_filter.messages["recent"][1] = now + 30
+    
+    log_filter._expire(now + 61)
+    assert list(log_filter.messages) == ["recent"]
+
+
+def test_rate_limit_expiry_runs_periodically_while_filtering():
+    """Every RATE_LIMIT_GC_INTERVAL records, stale entries are dropped"""
+    log_filter = RateLimitedLogFilter(rate=2, period=0)
+    log_filter.filter(make_record("stale"))
+    log_filter.messages["stale"][1] -= 1
+    
+    for _ in range(advanced_logging.RATE_LIMIT_GC_INTERVAL):
+        log_filter.filter(make_record("fresh"))
+    assert "stale" not in log_filter.messages
+
+
+def test_rate_limit_expiry_tolerates_concurrent_inserts():
+    """_expire can run while other threads add new messages"""
+    log_filter = RateLimitedLogFilter(rate=2, period=0)
+    stop = threading.Event()
+    
+    def insert():
+        i = 0
+        while not stop.is_set():
+            log_filter.messages[f"message {i}"] = [1, 0.0]
+            i += 1
+    
+    thread = threading.Thread(target=insert)
+    thread.start()
+    try:
+        for _ in range(200):
+            log_filter._expire(1.0)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_queue_handler_resolves_the_message_on_a_copy():
+    """prepare() interpolates the message without touching the caller's record"""
+    handler = RecordQueueHandler(queue.SimpleQueue())
+    record = make_record("user %s joined", "alice")
+    prepared = handler.prepare(record)
+    
+    assert prepared is not record
+    assert prepared.msg == "user alice joined"
+    assert prepared.args is None
+    assert record.msg == "user %s joined"
+    assert record.args == ("alice",)
+
+
+def test_queue_handler_keeps_exception_info():
+    """exc_info survives the queue so ErrorAggregator can read it"""
+    handler = RecordQueueHandler(queue.SimpleQueue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record("failed", exc_info=sys.exc_info())
+    prepared = handler.prepare(record)
+    
+    assert prepared.exc_info[0] is ValueError
+    assert prepared.msg == "failed"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: passed")
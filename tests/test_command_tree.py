@@ -0,0 +1,125 @@
+"""
+Tests for the command tree sync cache
+
+These tests use a fake native tree, so no Discord connection is needed.
+Run with pytest or directly: python tests/test_command_tree.py
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from utils import command_tree
+from utils.command_tree import CompatibilityCommandTree
+
+
+class FakeCommand:
+    """Command exposing the payload Discord stores for it"""
+    
+    def __init__(self, name, options=None):
+        self.name = name
+        self.options = options or []
+    
+    def to_dict(self):
+        return {"name": self.name, "description": "",
+                "options": [option.to_dict() for option in self.options]}
+
+
+class FakeOption:
+    """Option exposing its name and full payload like py-cord's Option"""
+    
+    def __init__(self, name, choices):
+        self.name = name
+        self.choices = choices
+    
+    def to_dict(self):
+        return {"name": self.name, "type": 3, "choices": self.choices}
+
+
+class FakeTree:
+    """Native tree counting the syncs that reach it"""
+    
+    def __init__(self, tree_commands):
+        self.tree_commands = tree_commands
+        self.syncs = []
+    
+    def get_commands(self, guild=None):
+        return self.tree_commands
+    
+    async def sync(self, guild=None):
+        self.syncs.append(guild)
+
+
+def make_tree(tree_commands):
+    """Build a CompatibilityCommandTree over a fake native tree"""
+    original = command_tree.PYCORD_261
+    command_tree.PYCORD_261 = True
+    try:
+        tree = CompatibilityCommandTree(SimpleNamespace(tree=FakeTree(tree_commands)))
+    finally:
+        command_tree.PYCORD_261 = original
+    return tree
+
+
+def run_sync(tree, guild=None):
+    """Sync with the py-cord code path enabled"""
+    original = command_tree.PYCORD_261
+    command_tree.PYCORD_261 = True
+    try:
+        return asyncio.run(tree.sync(guild))
+    finally:
+        command_tree.PYCORD_261 = original
+
+
+def test_unchanged_commands_skip_the_second_sync():
+    """Syncing the same commands again within the TTL doesn't call Discord"""
+    tree = make_tree([FakeCommand("stats")])
+    
+    assert run_sync(tree) is True
+    assert run_sync(tree) is True
+    assert len(tree._native_tree.syncs) == 1
+
+
+def test_option_changes_invalidate_the_cache():
+    """Changing an option's choices triggers a new sync even with the same names"""
+    option = FakeOption("mode", choices=[{"name": "a", "value": "a"}])
+    tree = make_tree([FakeCommand("stats", options=[option])])
+    
+    run_sync(tree)
+    option.choices.append({"name": "b", "value": "b"})
+    run_sync(tree)
+    assert len(tree._native_tree.syncs) == 2
+
+
+def test_cache_expires_after_ttl():
+    """Once SYNC_CACHE_TTL passes, unchanged commands are synced again"""
+    tree = make_tree([FakeCommand("stats")])
+    original_ttl = command_tree.SYNC_CACHE_TTL
+    command_tree.SYNC_CACHE_TTL = 0
+    try:
+        run_sync(tree)
+        run_sync(tree)
+    finally:
+        command_tree.SYNC_CACHE_TTL = original_ttl
+    assert len(tree._native_tree.syncs) == 2
+
+
+def test_guilds_are_cached_separately():
+    """A global sync doesn't mark a guild as synced"""
+    tree = make_tree([FakeCommand("stats")])
+    guild = SimpleNamespace(id=1)
+    
+    run_sync(tree)
+    run_sync(tree, guild)
+    run_sync(tree, guild)
+    assert tree._native_tree.syncs == [None, guild]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: passed")
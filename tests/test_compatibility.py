@@ -0,0 +1,85 @@
+"""
+Tests for the py-cord compatibility helpers
+
+Run with pytest or directly: python tests/test_compatibility.py
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from utils.compatibility import safely_parse_options
+
+
+def option(name, value):
+    """Build an option object like the ones py-cord passes in"""
+    return SimpleNamespace(name=name, value=value)
+
+
+def test_tuple_options_are_parsed_like_lists():
+    """Tuples of option objects or option dicts give the same result as lists"""
+    options = (option("a", 1), {"name": "b", "value": 2})
+    
+    assert safely_parse_options(options) == {"a": 1, "b": 2}
+    assert safely_parse_options(list(options)) == {"a": 1, "b": 2}
+
+
+def test_plain_dict_result_is_a_copy():
+    """Mutating the result doesn't change the payload it came from"""
+    options = {"a": 1}
+    result = safely_parse_options(options)
+    result["a"] = 2
+    
+    assert options == {"a": 1}
+
+
+def test_nested_containers_override_in_attribute_order():
+    """options, values and parameters are parsed in turn, later ones winning"""
+    payload = SimpleNamespace(
+        options=[option("a", "options"), option("b", "options")],
+        values={"a": "values"},
+        parameters=[{"name": "c", "value": "parameters"}],
+    )
+    
+    assert safely_parse_options(payload) == {"a": "values", "b": "options", "c": "parameters"}
+
+
+def test_self_referencing_containers_terminate():
+    """A container that refers back to itself is only parsed once"""
+    # A non-callable items attribute makes it look like a container to recurse into
+    payload = SimpleNamespace(items=None, values={"a": 1})
+    payload.options = payload
+    
+    assert safely_parse_options(payload) == {"a": 1}
+
+
+def test_get_only_objects_use_attribute_extraction():
+    """Objects with get() but no items() are read through their attributes"""
+    class GetOnly:
+        options = [option("a", 1)]
+        
+        def get(self, key, default=None):
+            raise AssertionError("get() should not be called")
+    
+    assert safely_parse_options(GetOnly()) == {"a": 1}
+
+
+def test_failing_attributes_are_skipped():
+    """A property that raises doesn't stop the remaining attributes being read"""
+    class Payload:
+        @property
+        def options(self):
+            raise RuntimeError("not loaded")
+        
+        values = {"a": 1}
+    
+    assert safely_parse_options(Payload()) == {"a": 1}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: passed")
@@ -0,0 +1,489 @@
+"""
+Tests for the safe database helpers
+
+These tests use in-memory fake collections, so no MongoDB server is needed.
+Run with pytest or directly: python tests/test_safe_database.py
+"""
+import asyncio
+import copy
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+
+from utils import safe_database
+from utils.safe_database import (
+    BatchedFinder,
+    BulkWriter,
+    count_documents_safely,
+    find_documents_safely,
+    get_document_safely,
+    invalidate_query_cache,
+    safe_insert_many,
+    safe_insert_one,
+    safely_update_document,
+)
+
+
+class FakeBulkWriteResult:
+    """Minimal stand-in for pymongo's BulkWriteResult"""
+    
+    def __init__(self, count):
+        self.bulk_api_result = {"writeErrors": [], "nModified": count}
+
+
+class FakeResult:
+    """Minimal stand-in for pymongo write results"""
+    
+    def __init__(self, **fields):
+        self.acknowledged = True
+        self.__dict__.update(fields)
+
+
+class FakeCursor:
+    """Minimal stand-in for a Motor cursor supporting the chained modifiers"""
+    
+    def __init__(self, docs):
+        self.docs = docs
+    
+    def sort(self, sort):
+        return self
+    
+    def limit(self, limit):
+        self.docs = self.docs[:limit]
+        return self
+    
+    def batch_size(self, size):
+        return self
+    
+    async def to_list(self, length=None):
+        return [copy.deepcopy(doc) for doc in self.docs]
+
+
+class FakeClient:
+    """Stand-in client, only used for its identity"""
+
+
+class FakeDatabase:
+    """Stand-in database exposing the client that owns it"""
+    
+    def __init__(self, client=None):
+        self.client = client or FakeClient()
+
+
+def _id_key(value):
+    # Like the server, never match a bool against a number
+    return (type(value) is bool, value)
+
+
+class FakeCollection:
+    """In-memory collection recording the calls and reads made to it"""
+    
+    def __init__(self, full_name="test.items", docs=None, write_errors=None,
+                 find_error=None, database=None):
+        self.full_name = full_name
+        self.database = database or FakeDatabase()
+        self.docs = docs or []
+        self.write_errors = write_errors or []
+        self.find_error = find_error
+        self.bulk_calls = []
+        self.find_calls = []
+        self.reads = 0
+        self.write_gate = None
+    
+    def _matches(self, query):
+        def match(doc, key, value):
+            if isinstance(value, dict) and "$in" in value:
+                return _id_key(doc.get(key)) in {_id_key(v) for v in value["$in"]}
+            return _id_key(doc.get(key)) == _id_key(value)
+        return [doc for doc in self.docs
+                if all(match(doc, key, value) for key, value in query.items())]
+    
+    async def count_documents(self, query):
+        self.reads += 1
+        return len(self._matches(query))
+    
+    def find(self, query, projection=None):
+        self.reads += 1
+        self.find_calls.append(query)
+        if self.find_error is not None:
+            raise self.find_error
+        return FakeCursor(self._matches(query))
+    
+    async def find_one(self, query, projection=None):
+        self.reads += 1
+        matches = self._matches(query)
+        return copy.deepcopy(matches[0]) if matches else None
+    
+    async def insert_one(self, document):
+        if self.write_gate is not None:
+            await self.write_gate.wait()
+        if "_id" in document and self._matches({"_id": document["_id"]}):
+            raise DuplicateKeyError("duplicate key", 11000)
+        self.docs.append(document)
+        return FakeResult(inserted_id=document.get("_id", len(self.docs)))
+    
+    async def insert_many(self, documents, ordered=True):
+        existing = {doc.get("_id") for doc in self.docs}
+        inserted, errors = [], []
+        for index, document in enumerate(documents):
+            if document.get("_id") in existing:
+                errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+                continue
+            existing.add(document.get("_id"))
+            self.docs.append(document)
+            inserted.append(document.get("_id"))
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(inserted)})
+        return FakeResult(inserted_ids=inserted)
+    
+    async def update_one(self, query, update, upsert=False):
+        if self.write_gate is not None:
+            await self.write_gate.wait()
+        matches = self._matches(query)
+        for doc in matches:
+            doc.update(update.get("$set", {}))
+        return FakeResult(modified_count=len(matches), upserted_id=None)
+    
+    async def bulk_write(self, ops, ordered=True):
+        self.bulk_calls.append((list(ops), ordered))
+        if self.write_errors:
+            raise BulkWriteError({"writeErrors": self.write_errors, "nModified": 0})
+        return FakeBulkWriteResult(len(ops))
+
+
+def test_bulk_writer_is_a_singleton():
+    """BulkWriter.instance() always returns the same writer"""
+    assert BulkWriter.instance() is BulkWriter.instance()
+
+
+def test_bulk_writer_flushes_after_interval():
+    """Updates queued together are sent as one unordered bulk_write"""
+    async def run():
+        writer = BulkWriter(max_batch=100, flush_interval=0.001)
+        collection = FakeCollection()
+        futures = [writer.add(collection, {"_id": i}, {"$set": {"n": i}}) for i in range(3)]
+        results = await asyncio.gather(*futures)
+        
+        assert results == [True, True, True]
+        assert len(collection.bulk_calls) == 1
+        ops, ordered = collection.bulk_calls[0]
+        assert len(ops) == 3
+        assert ordered is False
+    
+    asyncio.run(run())
+
+
+def test_bulk_writer_flushes_at_max_batch():
+    """Reaching max_batch flushes immediately instead of waiting for the timer"""
+    async def run():
+        writer = BulkWriter(max_batch=2, flush_interval=60)
+        collection = FakeCollection()
+        futures = [writer.add(collection, {"_id": i}, {"$set": {"n": i}}) for i in range(2)]
+        results = await asyncio.wait_for(asyncio.gather(*futures), timeout=1)
+        
+        assert results == [True, True]
+        assert len(collection.bulk_calls) == 1
+        assert not writer._handles
+    
+    asyncio.run(run())
+
+
+def test_bulk_writer_maps_write_errors_to_operations():
+    """Each write error fails only the operation at its index"""
+    async def run():
+        writer = BulkWriter(max_batch=100, flush_interval=0.001)
+        collection = FakeCollection(write_errors=[{"index": 1, "code": 11000, "errmsg": "duplicate"}])
+        futures = [writer.add(collection, {"_id": i}, {"$set": {"n": i}}) for i in range(3)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        
+        assert results[0] is True
+        assert isinstance(results[1], OperationFailure)
+        assert results[1].code == 11000
+        assert results[2] is True
+    
+    asyncio.run(run())
+
+
+def test_batched_update_reports_failure_for_its_write_error():
+    """safely_update_document(batched=True) returns False when its own op failed"""
+    async def run():
+        BulkWriter._instance = BulkWriter(max_batch=100, flush_interval=0.001)
+        collection = FakeCollection(write_errors=[{"index": 0, "code": 11000, "errmsg": "duplicate"}])
+        try:
+            result = await safely_update_document(collection, {"_id": 1}, {"$set": {"n": 1}},
+                                                  batched=True)
+        finally:
+            BulkWriter._instance = None
+        assert result is False
+    
+    asyncio.run(run())
+
+
+def test_bulk_writer_invalidates_cache_after_write():
+    """The collection's cache generation only changes once the bulk write lands"""
+    async def run():
+        writer = BulkWriter(max_batch=100, flush_interval=0.001)
+        collection = FakeCollection(full_name="test.bulk_invalidate")
+        generations = safe_database._cache_generations
+        before = generations.get(collection.full_name, 0)
+        
+        future = writer.add(collection, {"_id": 1}, {"$set": {"n": 1}})
+        assert generations.get(collection.full_name, 0) == before
+        await future
+        assert generations.get(collection.full_name, 0) == before + 1
+    
+    asyncio.run(run())
+
+
+def test_cached_count_is_reused_until_ttl_expires():
+    """Identical counts hit the cache until the TTL passes"""
+    async def run():
+        invalidate_query_cache()
+        collection = FakeCollection(docs=[{"kind": "a"}])
+        
+        assert await count_documents_safely(collection, {"kind": "a"}, cache_ttl=0.05) == 1
+        assert await count_documents_safely(collection, {"kind": "a"}, cache_ttl=0.05) == 1
+        assert collection.reads == 1
+        
+        time.sleep(0.06)
+        assert await count_documents_safely(collection, {"kind": "a"}, cache_ttl=0.05) == 1
+        assert collection.reads == 2
+    
+    asyncio.run(run())
+
+
+def test_cached_find_returns_independent_copies():
+    """Callers mutating cached results don't change what the cache returns"""
+    async def run():
+        invalidate_query_cache()
+        collection = FakeCollection(docs=[{"kind": "a", "n": {"v": 1}}])
+        
+        first = await find_documents_safely(collection, {"kind": "a"}, cache_ttl=10)
+        first[0]["n"]["v"] = 99
+        second = await find_documents_safely(collection, {"kind": "a"}, cache_ttl=10)
+        
+        assert second == [{"kind": "a", "n": {"v": 1}}]
+        assert collection.reads == 1
+    
+    asyncio.run(run())
+
+
+def test_cache_evicts_least_recently_used_entries():
+    """The cache never holds more than QUERY_CACHE_MAX_ENTRIES entries"""
+    async def run():
+        invalidate_query_cache()
+        collection = FakeCollection(docs=[{"n": 1}, {"n": 2}, {"n": 3}])
+        original_max = safe_database.QUERY_CACHE_MAX_ENTRIES
+        safe_database.QUERY_CACHE_MAX_ENTRIES = 2
+        try:
+            for n in (1, 2):
+                await count_documents_safely(collection, {"n": n}, cache_ttl=10)
+            # Touch n=1 so n=2 becomes the least recently used entry
+            await count_documents_safely(collection, {"n": 1}, cache_ttl=10)
+            await count_documents_safely(collection, {"n": 3}, cache_ttl=10)
+            assert len(safe_database._query_cache) == 2
+            assert collection.reads == 3
+            
+            await count_documents_safely(collection, {"n": 1}, cache_ttl=10)
+            assert collection.reads == 3
+            await count_documents_safely(collection, {"n": 2}, cache_ttl=10)
+            assert collection.reads == 4
+        finally:
+            safe_database.QUERY_CACHE_MAX_ENTRIES = original_max
+    
+    asyncio.run(run())
+
+
+def test_writes_invalidate_cached_reads():
+    """Updates and inserts through the helpers drop the collection's cached reads"""
+    async def run():
+        invalidate_query_cache()
+        collection = FakeCollection(docs=[{"_id": 1, "kind": "a"}])
+        
+        assert await count_documents_safely(collection, {"kind": "b"}, cache_ttl=10) == 0
+        await safely_update_document(collection, {"_id": 1}, {"$set": {"kind": "b"}})
+        assert await count_documents_safely(collection, {"kind": "b"}, cache_ttl=10) == 1
+        
+        await safe_insert_one(collection, {"_id": 2, "kind": "b"})
+        assert await count_documents_safely(collection, {"kind": "b"}, cache_ttl=10) == 2
+    
+    asyncio.run(run())
+
+
+def test_read_overlapping_a_write_is_not_served_afterwards():
+    """A read cached while a write is in flight must not outlive the write"""
+    async def run():
+        invalidate_query_cache()
+        collection = FakeCollection(docs=[{"_id": 1, "kind": "a"}])
+        collection.write_gate = asyncio.Event()
+        
+        write = asyncio.ensure_future(
+            safely_update_document(collection, {"_id": 1}, {"$set": {"kind": "b"}})
+        )
+        await asyncio.sleep(0)
+        # The write hasn't landed yet, so this caches the old count
+        assert await count_documents_safely(collection, {"kind": "b"}, cache_ttl=10) == 0
+        
+        collection.write_gate.set()
+        assert await write is True
+        assert await count_documents_safely(collection, {"kind": "b"}, cache_ttl=10) == 1
+    
+    asyncio.run(run())
+
+
+def test_negative_results_are_cached_until_a_write():
+    """Misses are remembered for negative_ttl and forgotten after an insert"""
+    async def run():
+        invalidate_query_cache()
+        collection = FakeCollection()
+        
+        assert await get_document_safely(collection, {"name": "x"}, negative_ttl=10) is None
+        assert await get_document_safely(collection, {"name": "x"}, negative_ttl=10) is None
+        assert collection.reads == 1
+        
+        await safe_insert_one(collection, {"_id": 1, "name": "x"})
+        found = await get_document_safely(collection, {"name": "x"}, negative_ttl=10)
+        assert found == {"_id": 1, "name": "x"}
+        assert collection.reads == 2
+    
+    asyncio.run(run())
+
+
+def test_insert_one_reports_duplicate_keys_as_failure():
+    """Inserting an existing _id fails without overwriting the stored document"""
+    async def run():
+        collection = FakeCollection(docs=[{"_id": 1, "name": "original"}])
+        
+        assert await safe_insert_one(collection, {"_id": 1, "name": "replacement"}) is None
+        assert collection.docs == [{"_id": 1, "name": "original"}]
+        assert await safe_insert_one(collection, {"_id": 2, "name": "new"}) == "2"
+    
+    asyncio.run(run())
+
+
+def test_insert_many_counts_only_new_documents():
+    """Unordered bulk inserts keep going past duplicates and count what was written"""
+    async def run():
+        collection = FakeCollection(docs=[{"_id": 1, "name": "original"}])
+        documents = [{"_id": 1, "name": "replacement"}, {"_id": 2}, {"_id": 3}]
+        
+        assert await safe_insert_many(collection, documents) == 2
+        assert collection.docs[0] == {"_id": 1, "name": "original"}
+        assert [doc["_id"] for doc in collection.docs] == [1, 2, 3]
+    
+    asyncio.run(run())
+
+
+def test_fingerprint_distinguishes_queries_and_handles_non_bson_values():
+    """Different queries get different keys; unencodable queries still get a key"""
+    collection = FakeCollection()
+    fingerprint = safe_database._query_fingerprint
+    
+    assert fingerprint(collection, "find", {"a": 1}) == fingerprint(collection, "find", {"a": 1})
+    assert fingerprint(collection, "find", {"a": 1}) != fingerprint(collection, "find", {"a": 2})
+    assert fingerprint(collection, "find", {"a": 1}, limit=1) != fingerprint(collection, "find", {"a": 1})
+    # Integer keys can't be BSON-encoded and fall back to JSON
+    assert fingerprint(collection, "find", {1: "a"}) is not None
+
+
+def test_id_lookups_are_batched():
+    """Concurrent _id lookups share one $in query and each get their own document"""
+    async def run():
+        collection = FakeCollection(docs=[{"_id": 1, "n": 1}, {"_id": 2, "n": 2}])
+        results = await asyncio.gather(*(
+            get_document_safely(collection, {"_id": doc_id}, batched=True) for doc_id in (1, 2, 3)
+        ))
+        
+        assert results == [{"_id": 1, "n": 1}, {"_id": 2, "n": 2}, None]
+        assert len(collection.find_calls) == 1
+        assert sorted(collection.find_calls[0]["_id"]["$in"]) == [1, 2, 3]
+    
+    asyncio.run(run())
+
+
+def test_id_lookups_are_not_batched_by_default():
+    """Without batched=True each lookup is its own find_one"""
+    async def run():
+        collection = FakeCollection(docs=[{"_id": 1}, {"_id": 2}])
+        results = await asyncio.gather(
+            get_document_safely(collection, {"_id": 1}),
+            get_document_safely(collection, {"_id": 2}),
+        )
+        
+        assert results == [{"_id": 1}, {"_id": 2}]
+        assert collection.reads == 2
+    
+    asyncio.run(run())
+
+
+def test_batched_ids_of_different_types_stay_separate():
+    """1 and True compare equal in Python but are different _id values"""
+    async def run():
+        collection = FakeCollection(docs=[{"_id": 1, "kind": "int"}])
+        as_int, as_bool = await asyncio.gather(
+            get_document_safely(collection, {"_id": 1}, batched=True),
+            get_document_safely(collection, {"_id": True}, batched=True),
+        )
+        
+        assert as_int == {"_id": 1, "kind": "int"}
+        assert as_bool is None
+        assert len(collection.find_calls[0]["_id"]["$in"]) == 2
+    
+    asyncio.run(run())
+
+
+def test_duplicate_id_waiters_get_independent_copies():
+    """Mutating a nested field in one result must not leak into another"""
+    async def run():
+        collection = FakeCollection(docs=[{"_id": 1, "n": {"v": 1}}])
+        first, second = await asyncio.gather(
+            get_document_safely(collection, {"_id": 1}, batched=True),
+            get_document_safely(collection, {"_id": 1}, batched=True),
+        )
+        
+        first["n"]["v"] = 99
+        assert second == {"_id": 1, "n": {"v": 1}}
+    
+    asyncio.run(run())
+
+
+def test_batch_errors_propagate_to_every_waiter():
+    """A failing batch query fails each queued lookup"""
+    async def run():
+        collection = FakeCollection(find_error=RuntimeError("connection lost"))
+        futures = [BatchedFinder.for_collection(collection).get(doc_id) for doc_id in (1, 2)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        # The safe wrapper turns the error into a None result
+        assert await get_document_safely(collection, {"_id": 1}, batched=True) is None
+    
+    asyncio.run(run())
+
+
+def test_collections_from_different_clients_are_not_merged():
+    """Same-named collections on different clients get separate batches"""
+    async def run():
+        first = FakeCollection(docs=[{"_id": 1, "client": "first"}])
+        second = FakeCollection(docs=[{"_id": 1, "client": "second"}])
+        results = await asyncio.gather(
+            get_document_safely(first, {"_id": 1}, batched=True),
+            get_document_safely(second, {"_id": 1}, batched=True),
+        )
+        
+        assert [result["client"] for result in results] == ["first", "second"]
+        assert len(first.find_calls) == len(second.find_calls) == 1
+    
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: passed")
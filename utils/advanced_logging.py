@@ -15,6 +15,8 @@ import logging
 import logging.handlers
 import os
 import sys
+import copy
+import atexit
 import traceback
 import asyncio
 import time
@@ -25,14 +27,34 @@ from enum import Enum
 from typing import Dict, List, Set, Any, Optional, Tuple, Union, Callable, cast
 from datetime import datetime, timedelta
 from functools import wraps
+from collections import OrderedDict, deque
 import threading
 import queue
 
 # Discord webhook client for logging critical errors
 try:
-    import aiohttp
+    import requests
+    import requests.adapters
 except ImportError:
-    aiohttp = None
+    requests = None
+
+# Optional multi-pattern scanner for success filtering
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Hash used to deduplicate aggregated errors
+try:
+    from blake3 import blake3 as error_hash
+except ImportError:
+    error_hash = hashlib.sha256
+
+# Number of innermost traceback frames used to identify an error
+ERROR_HASH_FRAMES = 3
+
+# Tail of each aggregated traceback kept in ERROR_CACHE
+ERROR_TRACEBACK_MAX_CHARS = 4096
 
 # Default log settings
 DEFAULT_LOG_DIR = "logs"
@@ -44,16 +66,29 @@ DEFAULT_LOG_LEVEL = logging.INFO
 # Discord webhook settings
 DISCORD_WEBHOOK_URL = os.environ.get("LOG_WEBHOOK_URL")
 DISCORD_RATE_LIMIT = 5  # Max messages per minute
+WEBHOOK_MAX_EMBEDS = 10  # Discord accepts up to 10 embeds per message
+WEBHOOK_LEVEL_COLORS = (  # Embed color indexed by level // 10
+    0x3498DB,  # Blue (below WARNING)
+    0x3498DB,
+    0x3498DB,
+    0xF1C40F,  # Yellow (WARNING)
+    0xE67E22,  # Orange (ERROR)
+    0xE74C3C,  # Red (CRITICAL and above)
+)
+
+# Number of filtered records between sweeps of RateLimitedLogFilter's cache
+RATE_LIMIT_GC_INTERVAL = 256
 
 # Error aggregation
-ERROR_CACHE = {}  # hash -> {count, last_time, traceback}
+ERROR_CACHE = OrderedDict()  # hash -> {count, last_time, traceback}, least recently seen first
+ERROR_CACHE_LOCK = threading.Lock()  # Guards ERROR_CACHE
 ERROR_CACHE_TTL = 3600  # 1 hour
 ERROR_RATE_LIMIT = 3  # Max same error per hour
 
 # Audit trail settings
 AUDIT_LOG_ENABLED = True
 AUDIT_LOG_LEVEL = logging.INFO
-AUDIT_TARGETS = ["command", "admin", "moderation", "data", "connection"]
+AUDIT_TARGETS = frozenset({"command", "admin", "moderation", "data", "connection"})
 
 
 class LogLevel(Enum):
@@ -69,6 +104,59 @@ class LogLevel(Enum):
     EMERGENCY = 60
 
 
+# Names of the standard levels, resolved once. Other levels are looked up on
+# demand so names registered later with logging.addLevelName() still apply.
+LEVEL_NAMES = {
+    level: logging.getLevelName(level)
+    for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+}
+
+
+def get_level_name(level: int) -> str:
+    """Get the name of a log level
+    
+    Args:
+        level: Log level
+        
+    Returns:
+        str: Level name
+    """
+    return LEVEL_NAMES.get(level) or logging.getLevelName(level)
+
+
+# Log directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def ensure_log_dir(log_dir: str):
+    """Create a log directory once per process
+    
+    Args:
+        log_dir: Log directory
+    """
+    if log_dir not in _ENSURED_DIRS:
+        os.makedirs(log_dir, exist_ok=True)
+        _ENSURED_DIRS.add(log_dir)
+
+
+def get_record_message(record: logging.LogRecord) -> str:
+    """Get the interpolated message of a record, computing it only once
+    
+    The same record passes through the filters of every handler, so the
+    result of record.getMessage() is stored on the record.
+    
+    Args:
+        record: Log record
+        
+    Returns:
+        str: Log message
+    """
+    message = getattr(record, "_cached_message", None)
+    if message is None:
+        message = record._cached_message = record.getMessage()
+    return message
+
+
 class ContextAdapter(logging.LoggerAdapter):
     """Logger adapter that adds context to log messages"""
     
@@ -98,7 +186,20 @@ class RateLimitedLogFilter(logging.Filter):
         super().__init__()
         self.rate = rate
         self.period = period
-        self.messages = {}  # message -> (count, first_time)
+        self.messages = {}  # message -> [count, first_time]
+        self._calls = 0
+        
+    def _expire(self, now: float):
+        """Drop entries whose rate limit period has passed
+        
+        Args:
+            now: Current time
+        """
+        # Iterate a snapshot: other threads may add messages while this runs
+        expired = [key for key, (_, first_time) in list(self.messages.items())
+                   if now - first_time > self.period]
+        for key in expired:
+            self.messages.pop(key, None)
         
     def filter(self, record):
         """Filter log record
@@ -110,31 +211,39 @@ class RateLimitedLogFilter(logging.Filter):
             bool: Whether to include the record
         """
         # Always allow non-duplicated messages
-        message = record.getMessage()
+        message = get_record_message(record)
         now = time.time()
         
+        # Periodically forget messages that stopped repeating
+        self._calls += 1
+        if self._calls >= RATE_LIMIT_GC_INTERVAL:
+            self._calls = 0
+            self._expire(now)
+        
         # Check if message is in cache
-        if message in self.messages:
-            count, first_time = self.messages[message]
-            
+        entry = self.messages.get(message)
+        if entry is not None:
             # Reset if period has passed
-            if now - first_time > self.period:
-                self.messages[message] = (1, now)
+            if now - entry[1] > self.period:
+                entry[0] = 1
+                entry[1] = now
                 return True
                 
             # Increment count and rate limit
-            count += 1
-            self.messages[message] = (count, first_time)
+            entry[0] += 1
+            count = entry[0]
             
             if count > self.rate:
                 # Allow final message with count
                 if count == self.rate + 1:
                     record.msg = f"{message} (rate limited, repeated {count} times)"
+                    record.args = None
+                    record._cached_message = record.msg
                     return True
                 return False
         else:
             # New message
-            self.messages[message] = (1, now)
+            self.messages[message] = [1, now]
             
         return True
 
@@ -156,8 +265,57 @@ class SuccessFilter(logging.Filter):
             r"Operation .* succeeded in \d+\.\d+s"
         ]
         
-        # Compile patterns
-        self.compiled_patterns = [re.compile(pattern) for pattern in self.success_patterns]
+        # Compile all patterns into a single alternation so each record is
+        # scanned once instead of once per pattern
+        self.success_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.success_patterns)
+        )
+        self._search = self.success_regex.search
+        
+        # Prefer a Hyperscan database that scans for all patterns in one pass
+        self.success_db = None
+        if hyperscan is not None:
+            try:
+                success_db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                success_db.compile(
+                    expressions=[pattern.encode() for pattern in self.success_patterns],
+                    ids=list(range(len(self.success_patterns))),
+                    elements=len(self.success_patterns),
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.success_patterns)
+                )
+            except Exception:
+                # Keep using the compiled regex if Hyperscan rejects a pattern
+                success_db = None
+            if success_db is not None:
+                self.success_db = success_db
+                # Scratch space can't be shared between threads
+                self._local = threading.local()
+        
+    def _is_success(self, message: str) -> bool:
+        """Check whether a message matches any success pattern
+        
+        Args:
+            message: Formatted log message
+            
+        Returns:
+            bool: Whether the message reports a successful operation
+        """
+        if self.success_db is None:
+            return self._search(message) is not None
+            
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.success_db)
+            
+        matches = []
+        
+        def on_match(pattern_id, *args):
+            matches.append(pattern_id)
+            # A truthy return stops the scan at the first match
+            return True
+        
+        self.success_db.scan(message.encode(), match_event_handler=on_match, scratch=scratch)
+        return bool(matches)
         
     def filter(self, record):
         """Filter log record
@@ -168,17 +326,27 @@ class SuccessFilter(logging.Filter):
         Returns:
             bool: Whether to include the record
         """
-        # Always keep errors and warnings
-        if record.levelno >= logging.WARNING:
-            return True
-            
-        # Check message against success patterns
-        message = record.getMessage()
-        for pattern in self.compiled_patterns:
-            if pattern.search(message):
-                return False  # Filter out successful operation
-                
-        return True  # Keep other messages
+        # Always keep errors and warnings, filter out successful operations
+        return record.levelno >= logging.WARNING or not self._is_success(get_record_message(record))
+
+
+def build_webhook_embed(message: str, level: int, record_time: float) -> Dict[str, Any]:
+    """Build a Discord embed for a log message
+    
+    Args:
+        message: Formatted log message
+        level: Log level
+        record_time: Record timestamp
+        
+    Returns:
+        Dict: Embed payload
+    """
+    return {
+        "title": f"Log Entry: {get_level_name(level)}",
+        "description": message,
+        "color": WEBHOOK_LEVEL_COLORS[min(level // 10, len(WEBHOOK_LEVEL_COLORS) - 1)],
+        "timestamp": datetime.fromtimestamp(record_time).isoformat()
+    }
 
 
 class DiscordWebhookHandler(logging.Handler):
@@ -197,11 +365,21 @@ class DiscordWebhookHandler(logging.Handler):
         super().__init__(level)
         self.webhook_url = webhook_url
         self.rate_limit = rate_limit
-        self.last_messages = []  # (time, message)
-        self.queue = queue.Queue(maxsize=max_queue)
+        self.last_messages = deque()  # (time, message), oldest first
+        self.max_queue = max_queue
+        self.queue = deque(maxlen=max_queue)  # (record, level, time)
+        self.queue_ready = threading.Condition()
         self.session = None
         self.worker = None
         self.shutdown_flag = False
+        self.rate_limited = False
+        
+        # Keep-alive connection pool, only used by the worker thread
+        if requests is not None:
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
         
         # Start worker thread
         self.start_worker()
@@ -214,90 +392,64 @@ class DiscordWebhookHandler(logging.Handler):
             
     def _worker_thread(self):
         """Worker thread to send webhook messages"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        async def run_worker():
-            # Create session
-            self.session = aiohttp.ClientSession()
-            
-            while not self.shutdown_flag:
-                try:
-                    # Get message from queue with timeout
-                    try:
-                        message, level, record_time = self.queue.get(timeout=1)
-                    except queue.Empty:
-                        await asyncio.sleep(0.1)
-                        continue
-                        
-                    # Check rate limit
-                    now = time.time()
-                    self.last_messages = [msg for msg in self.last_messages 
-                                         if now - msg[0] < 60]  # Keep last minute
-                                         
-                    if len(self.last_messages) >= self.rate_limit:
-                        # Rate limited, add summary message
-                        if len(self.last_messages) == self.rate_limit:
-                            await self._send_webhook_message(
-                                "💡 **Rate limit reached, logging paused for 60 seconds**",
-                                level, record_time
-                            )
-                        continue
+        while not self.shutdown_flag:
+            try:
+                # Wait for messages, then take whatever is already queued
+                # (up to one request's worth) as a single batch
+                with self.queue_ready:
+                    if not self.queue:
+                        self.queue_ready.wait(timeout=1)
+                    batch = []
+                    while self.queue and len(batch) < WEBHOOK_MAX_EMBEDS:
+                        batch.append(self.queue.popleft())
+                if not batch:
+                    continue
                         
-                    # Send message
-                    await self._send_webhook_message(message, level, record_time)
+                # Check rate limit - every embed counts as one message
+                now = time.time()
+                while self.last_messages and now - self.last_messages[0][0] >= 60:
+                    self.last_messages.popleft()  # Keep last minute
+                available = max(self.rate_limit - len(self.last_messages), 0)
+                
+                embeds = []
+                for record, level, record_time in batch[:available]:
+                    message = self.format(record)
+                    embeds.append(build_webhook_embed(message, level, record_time))
                     self.last_messages.append((now, message))
                     
-                    # Mark as done
-                    self.queue.task_done()
-                    
-                except Exception as e:
-                    print(f"Error in webhook worker: {e}")
-                    await asyncio.sleep(5)
+                if len(batch) > available:
+                    # Rate limited, add summary message once
+                    if not self.rate_limited:
+                        _, level, record_time = batch[available]
+                        embeds.append(build_webhook_embed(
+                            "💡 **Rate limit reached, logging paused for 60 seconds**",
+                            level, record_time
+                        ))
+                    self.rate_limited = True
+                else:
+                    self.rate_limited = False
                     
-            # Clean up
-            if self.session is not None:
-                await self.session.close()
+                # Send messages
+                if embeds:
+                    self._send_webhook_embeds(embeds)
                 
-        loop.run_until_complete(run_worker())
-        loop.close()
+            except Exception as e:
+                print(f"Error in webhook worker: {e}")
+                time.sleep(5)
         
-    async def _send_webhook_message(self, message: str, level: int, record_time: float):
-        """Send message to Discord webhook
+    def _send_webhook_embeds(self, embeds: List[Dict[str, Any]]):
+        """Send embeds to Discord webhook in a single request
         
         Args:
-            message: Message to send
-            level: Log level
-            record_time: Record timestamp
+            embeds: Embeds to send, at most WEBHOOK_MAX_EMBEDS
         """
-        if not self.session or not aiohttp:
+        if not self.session:
             return
             
-        # Format embed
-        color = 0x3498DB  # Blue (INFO)
-        if level >= logging.CRITICAL:
-            color = 0xE74C3C  # Red
-        elif level >= logging.ERROR:
-            color = 0xE67E22  # Orange
-        elif level >= logging.WARNING:
-            color = 0xF1C40F  # Yellow
-            
-        timestamp = datetime.fromtimestamp(record_time).isoformat()
-        
-        payload = {
-            "embeds": [{
-                "title": f"Log Entry: {logging.getLevelName(level)}",
-                "description": message,
-                "color": color,
-                "timestamp": timestamp
-            }]
-        }
-        
         try:
-            async with self.session.post(self.webhook_url, json=payload) as response:
-                if response.status >= 400:
-                    text = await response.text()
-                    print(f"Error sending to webhook: {response.status} - {text}")
+            response = self.session.post(self.webhook_url, json={"embeds": embeds}, timeout=5)
+            if response.status_code >= 400:
+                print(f"Error sending to webhook: {response.status_code} - {response.text}")
         except Exception as e:
             print(f"Failed to send to Discord webhook: {e}")
             
@@ -307,18 +459,24 @@ class DiscordWebhookHandler(logging.Handler):
         Args:
             record: Log record
         """
-        if not aiohttp or not self.webhook_url:
+        if not requests or not self.webhook_url:
             return
             
         try:
-            # Format message
-            message = self.format(record)
+            # Nothing to do if the worker is already backed up
+            if len(self.queue) >= self.max_queue:
+                return
+                
+            # Resolve the message arguments now, since they may change after
+            # this call, and leave the formatting to the worker thread
+            pending = copy.copy(record)
+            pending.msg = record.getMessage()
+            pending.args = None
             
             # Add to queue
-            try:
-                self.queue.put_nowait((message, record.levelno, record.created))
-            except queue.Full:
-                pass
+            with self.queue_ready:
+                self.queue.append((pending, record.levelno, record.created))
+                self.queue_ready.notify()
                 
         except Exception as e:
             print(f"Error in Discord webhook handler: {e}")
@@ -326,8 +484,12 @@ class DiscordWebhookHandler(logging.Handler):
     def close(self):
         """Clean up resources"""
         self.shutdown_flag = True
+        with self.queue_ready:
+            self.queue_ready.notify()
         if self.worker and self.worker.is_alive():
             self.worker.join(timeout=5)
+        if self.session is not None:
+            self.session.close()
         super().close()
 
 
@@ -344,53 +506,108 @@ class ErrorAggregator(logging.Handler):
         super().__init__(level)
         self.capacity = capacity
         
+    @staticmethod
+    def _touch(hash_key: str, now: float) -> bool:
+        """Count another occurrence of a known error
+        
+        Must be called with ERROR_CACHE_LOCK held.
+        
+        Args:
+            hash_key: Error hash
+            now: Current time
+            
+        Returns:
+            bool: Whether the error was already in the cache and not expired
+        """
+        entry = ERROR_CACHE.get(hash_key)
+        if entry is None or now - entry["last_time"] > ERROR_CACHE_TTL:
+            return False
+        entry["count"] += 1
+        entry["last_time"] = now
+        ERROR_CACHE.move_to_end(hash_key)
+        return True
+        
     def emit(self, record):
         """Emit log record
         
         Args:
             record: Log record
         """
-        if record.exc_info is None:
+        # Only records carrying an exception are aggregated
+        if not record.exc_info or record.exc_info[0] is None:
             return
             
         try:
-            # Get exception info
+            # Get exception info - source lines are only read for the frames
+            # that actually get formatted
             exc_type, exc_value, exc_tb = record.exc_info
-            tb_str = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+            tb_exc = traceback.TracebackException(exc_type, exc_value, exc_tb, lookup_lines=False)
             
-            # Create hash of traceback
-            hash_key = hashlib.md5(tb_str.encode()).hexdigest()
+            # Create hash from the innermost frames and the exception line only
+            hash_source = "".join(
+                traceback.StackSummary.from_list(tb_exc.stack[-ERROR_HASH_FRAMES:]).format()
+                + list(tb_exc.format_exception_only())
+            )
+            hash_key = error_hash(hash_source.encode()).hexdigest()[:16]
             
-            # Clean up old entries
+            # Repeat errors only need their counters updated
             now = time.time()
-            for key in list(ERROR_CACHE.keys()):
-                if now - ERROR_CACHE[key]["last_time"] > ERROR_CACHE_TTL:
-                    del ERROR_CACHE[key]
+            with ERROR_CACHE_LOCK:
+                if self._touch(hash_key, now):
+                    return
                     
-            # Check capacity
-            if len(ERROR_CACHE) >= self.capacity and hash_key not in ERROR_CACHE:
-                # Remove oldest entry
-                oldest_key = min(ERROR_CACHE.keys(), key=lambda k: ERROR_CACHE[k]["last_time"])
-                del ERROR_CACHE[oldest_key]
-                
-            # Update or add entry
-            if hash_key in ERROR_CACHE:
-                ERROR_CACHE[hash_key]["count"] += 1
-                ERROR_CACHE[hash_key]["last_time"] = now
-            else:
-                ERROR_CACHE[hash_key] = {
-                    "count": 1,
-                    "first_time": now,
-                    "last_time": now,
-                    "traceback": tb_str,
-                    "message": record.getMessage(),
-                    "level": record.levelno
-                }
+            # Format the new entry outside the lock
+            new_entry = {
+                "count": 1,
+                "first_time": now,
+                "last_time": now,
+                "traceback": "".join(tb_exc.format())[-ERROR_TRACEBACK_MAX_CHARS:],
+                "message": record.getMessage(),
+                "level": record.levelno
+            }
+            
+            with ERROR_CACHE_LOCK:
+                # Another thread may have added the same error meanwhile
+                if self._touch(hash_key, now):
+                    return
+                    
+                # Clean up old entries - the cache is kept in last-seen order,
+                # so expired entries are always at the front
+                while ERROR_CACHE and now - next(iter(ERROR_CACHE.values()))["last_time"] > ERROR_CACHE_TTL:
+                    ERROR_CACHE.popitem(last=False)
+                    
+                # Check capacity - remove least recently seen entry
+                if len(ERROR_CACHE) >= self.capacity:
+                    ERROR_CACHE.popitem(last=False)
+                    
+                ERROR_CACHE[hash_key] = new_entry
                 
         except Exception as e:
             print(f"Error in error aggregator: {e}")
 
 
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps exception info on the queued records
+    
+    The stock QueueHandler formats the record on the calling thread and drops
+    exc_info, which ErrorAggregator needs on the listener side.
+    """
+    
+    def prepare(self, record):
+        """Prepare record for queuing
+        
+        Args:
+            record: Log record
+            
+        Returns:
+            LogRecord: Copy of the record with its message resolved
+        """
+        record = copy.copy(record)
+        record.msg = get_record_message(record)
+        record.args = None
+        return record
+
+
 class AuditLogger:
     """Logger for tracking user actions and system events"""
     
@@ -403,9 +620,9 @@ class AuditLogger:
         """
         self.logger = logging.getLogger(logger_name)
         
-        if AUDIT_LOG_ENABLED is not None:
+        if AUDIT_LOG_ENABLED:
             # Ensure log directory exists
-            os.makedirs(log_dir, exist_ok=True)
+            ensure_log_dir(log_dir)
             
             # Create audit log file handler
             audit_log_file = os.path.join(log_dir, "audit.log")
@@ -434,7 +651,7 @@ class AuditLogger:
             target: Action target (command, admin, moderation, etc.)
             metadata: Additional metadata
         """
-        if not AUDIT_LOG_ENABLED or target not in AUDIT_TARGETS:
+        if not AUDIT_LOG_ENABLED or target not in AUDIT_TARGETS or not self.logger.isEnabledFor(level):
             return
             
         # Create extra context
@@ -448,11 +665,10 @@ class AuditLogger:
         
         # Add metadata if provided
         if metadata is not None:
-            for key, value in metadata.items():
-                extra[key] = value
+            extra.update(metadata)
                 
         # Log with extra context
-        self.logger.log(level, f"{action}: {details}", extra=extra)
+        self.logger.log(level, "%s: %s", action, details, extra=extra)
         
     def command(self, username: str, guild_id: Optional[str], command: str, 
                args: Optional[str] = None, success: bool = True):
@@ -465,6 +681,9 @@ class AuditLogger:
             args: Command arguments
             success: Whether the command was successful
         """
+        if not AUDIT_LOG_ENABLED:
+            return
+            
         status = "succeeded" if success else "failed"
         args_str = f" with args: {args}" if args else ""
         self.log_action(
@@ -483,6 +702,9 @@ class AuditLogger:
             action: Action performed
             target: Target of the action
         """
+        if not AUDIT_LOG_ENABLED:
+            return
+            
         self.log_action(
             username, guild_id, "admin_action",
             f"{action} on {target}",
@@ -501,6 +723,9 @@ class AuditLogger:
             operation: Operation performed (create, update, delete)
             item_id: ID of the changed item
         """
+        if not AUDIT_LOG_ENABLED:
+            return
+            
         self.log_action(
             username, guild_id, "data_change",
             f"{operation} {data_type} {item_id}",
@@ -519,6 +744,9 @@ class AuditLogger:
             status: Connection status
             details: Additional details
         """
+        if not AUDIT_LOG_ENABLED:
+            return
+            
         self.log_action(
             username, guild_id, "connection",
             f"{connection_type} {status}" + (f": {details}" if details else ""),
@@ -549,8 +777,8 @@ class AdvancedLoggingSystem:
         self.root_logger = logging.getLogger()
         
         # Ensure log directory exists
-        if log_to_file is not None:
-            os.makedirs(log_dir, exist_ok=True)
+        if log_to_file:
+            ensure_log_dir(log_dir)
             
         # Configure root logger
         self.root_logger.setLevel(level)
@@ -559,48 +787,61 @@ class AdvancedLoggingSystem:
         for handler in list(self.root_logger.handlers):
             self.root_logger.removeHandler(handler)
             
+        # Output handlers run on a listener thread; the root logger only
+        # enqueues records, so disk writes never block the caller
+        handlers = []
+        formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
+            
         # Add console handler if enabled
-        if log_to_console is not None:
+        if log_to_console:
             console_handler = logging.StreamHandler()
-            console_formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-            console_handler.setFormatter(console_formatter)
+            console_handler.setFormatter(formatter)
             console_handler.setLevel(level)
-            self.root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
             
         # Add file handler if enabled
-        if log_to_file is not None:
+        if log_to_file:
             # Main log file
             log_file = os.path.join(log_dir, f"{app_name}.log")
             file_handler = logging.handlers.RotatingFileHandler(
                 log_file, maxBytes=DEFAULT_MAX_BYTES, backupCount=DEFAULT_BACKUP_COUNT
             )
-            file_formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(formatter)
             file_handler.setLevel(level)
-            self.root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
             # Error log file (ERROR and above)
             error_log_file = os.path.join(log_dir, f"{app_name}_error.log")
             error_handler = logging.handlers.RotatingFileHandler(
                 error_log_file, maxBytes=DEFAULT_MAX_BYTES, backupCount=DEFAULT_BACKUP_COUNT
             )
-            error_formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-            error_handler.setFormatter(error_formatter)
+            error_handler.setFormatter(formatter)
             error_handler.setLevel(logging.ERROR)
-            self.root_logger.addHandler(error_handler)
+            handlers.append(error_handler)
             
         # Add Discord webhook handler if enabled
-        if log_to_discord and DISCORD_WEBHOOK_URL and aiohttp:
+        if log_to_discord and DISCORD_WEBHOOK_URL and requests:
             discord_handler = DiscordWebhookHandler(
                 DISCORD_WEBHOOK_URL, level=logging.ERROR, rate_limit=DISCORD_RATE_LIMIT
             )
             discord_formatter = logging.Formatter("%(levelname)s: %(message)s")
             discord_handler.setFormatter(discord_formatter)
-            self.root_logger.addHandler(discord_handler)
+            handlers.append(discord_handler)
             
         # Add error aggregator
         error_aggregator = ErrorAggregator(level=logging.ERROR)
-        self.root_logger.addHandler(error_aggregator)
+        handlers.append(error_aggregator)
+        
+        self.handlers = handlers
+        self._log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
+        
+        queue_handler = RecordQueueHandler(self._log_queue)
+        self.root_logger.addHandler(queue_handler)
         
         # Add rate limit filter
         rate_limit_filter = RateLimitedLogFilter()
@@ -611,7 +852,14 @@ class AdvancedLoggingSystem:
         self.audit_logger = AuditLogger(logger_name=f"{app_name}.audit", log_dir=log_dir)
         
         # Log initialization
-        logging.info(f"Advanced logging system initialized: {app_name}")
+        logging.info("Advanced logging system initialized: %s", app_name)
+        
+    def shutdown(self):
+        """Stop the listener thread, flushing records that are still queued"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            atexit.unregister(self.shutdown)
         
     def get_logger(self, name: str, context: Optional[Dict[str, Any]] = None):
         """Get logger with optional context
@@ -643,37 +891,52 @@ class AdvancedLoggingSystem:
             details: Additional details
             level: Log level
         """
+        if not self.root_logger.isEnabledFor(level):
+            return
+            
         status = "succeeded" if success else "failed"
-        message = f"Operation '{operation}' {status} in {elapsed_time:.3f}s"
-        
         if details is not None:
-            message += f": {details}"
-            
-        logging.log(level, message)
+            logging.log(level, "Operation '%s' %s in %.3fs: %s", operation, status, elapsed_time, details)
+        else:
+            logging.log(level, "Operation '%s' %s in %.3fs", operation, status, elapsed_time)
         
-    def get_error_summary(self) -> List[Dict[str, Any]]:
+    def get_error_summary(self, raw: bool = False) -> List[Dict[str, Any]]:
         """Get summary of aggregated errors
         
+        Args:
+            raw: Return times as epoch seconds instead of ISO strings
+            
         Returns:
             List of error summaries
         """
         result = []
+        fromtimestamp = datetime.fromtimestamp
+        
+        with ERROR_CACHE_LOCK:
+            errors = [dict(error) for error in ERROR_CACHE.values()]
         
-        for hash_key, error in ERROR_CACHE.items():
+        for error in errors:
+            first_time = error["first_time"]
+            last_time = error["last_time"]
+            if not raw:
+                first_time = fromtimestamp(first_time).isoformat()
+                last_time = fromtimestamp(last_time).isoformat()
+                
             result.append({
                 "count": error["count"],
-                "first_time": datetime.fromtimestamp(error["first_time"]).isoformat(),
-                "last_time": datetime.fromtimestamp(error["last_time"]).isoformat(),
+                "first_time": first_time,
+                "last_time": last_time,
                 "message": error["message"],
-                "level": logging.getLevelName(error["level"]),
-                "traceback_preview": error["traceback"].split("\n")[-1]
+                "level": get_level_name(error["level"]),
+                "traceback_preview": error["traceback"].rstrip("\n").split("\n")[-1]
             })
             
         return sorted(result, key=lambda x: x["count"], reverse=True)
         
     def reset_error_cache(self):
         """Clear error aggregation cache"""
-        ERROR_CACHE.clear()
+        with ERROR_CACHE_LOCK:
+            ERROR_CACHE.clear()
         logging.info("Error aggregation cache cleared")
 
 
@@ -688,10 +951,18 @@ def timed_operation(name: Optional[str] = None, level: int = logging.DEBUG):
         Decorator function
     """
     def decorator(func):
+        perf_counter_ns = time.perf_counter_ns
+        # isEnabledFor() is cached by logging and reset on level changes, so
+        # checking it per call is cheap and follows runtime reconfiguration
+        is_enabled = logging.getLogger().isEnabledFor
+        
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
+            if not is_enabled(level):
+                return await func(*args, **kwargs)
+                
             operation = name or func.__name__
-            start_time = time.time()
+            start_ns = perf_counter_ns()
             success = True
             
             try:
@@ -701,16 +972,20 @@ def timed_operation(name: Optional[str] = None, level: int = logging.DEBUG):
                 success = False
                 raise
             finally:
-                elapsed = time.time() - start_time
+                elapsed = (perf_counter_ns() - start_ns) / 1e9
                 logging.log(
                     level,
-                    f"Operation '{operation}' {'succeeded' if success else 'failed'} in {elapsed:.3f}s"
+                    "Operation '%s' %s in %.3fs",
+                    operation, 'succeeded' if success else 'failed', elapsed
                 )
                 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
+            if not is_enabled(level):
+                return func(*args, **kwargs)
+                
             operation = name or func.__name__
-            start_time = time.time()
+            start_ns = perf_counter_ns()
             success = True
             
             try:
@@ -720,10 +995,11 @@ def timed_operation(name: Optional[str] = None, level: int = logging.DEBUG):
                 success = False
                 raise
             finally:
-                elapsed = time.time() - start_time
+                elapsed = (perf_counter_ns() - start_ns) / 1e9
                 logging.log(
                     level,
-                    f"Operation '{operation}' {'succeeded' if success else 'failed'} in {elapsed:.3f}s"
+                    "Operation '%s' %s in %.3fs",
+                    operation, 'succeeded' if success else 'failed', elapsed
                 )
                 
         return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
@@ -747,7 +1023,7 @@ def init_logging(app_name: str = "tower_of_temptation", log_to_discord: bool = F
     )
     
     # Add success filter if enabled
-    if filter_success is not None:
+    if filter_success:
         success_filter = SuccessFilter()
         for handler in logging.getLogger().handlers:
             handler.addFilter(success_filter)
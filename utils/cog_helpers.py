@@ -13,7 +13,6 @@ import discord
 from discord.ext import commands
 
 from utils.command_imports import (
-    is_compatible_with_pycord_261, 
     HAS_APP_COMMANDS,
     PYCORD_261,
     IS_PYCORD
@@ -68,8 +67,8 @@ def register_command_in_cog(
                 description = description.strip().split("\n")[0]
         
         # Check if we're using py-cord 2.6.1
-        if is_compatible_with_pycord_261():
-            logger.info(f"Registering command {name} in cog {cog.__class__.__name__} using py-cord 2.6.1 compatibility")
+        if PYCORD_261:
+            logger.info("Registering command %s in cog %s using py-cord 2.6.1 compatibility", name, cog.__class__.__name__)
             
             # Use our enhanced decorator
             command = enhanced_slash_command(
@@ -86,7 +85,7 @@ def register_command_in_cog(
             return command
         elif HAS_APP_COMMANDS:
             # Discord.py style
-            logger.info(f"Registering command {name} in cog {cog.__class__.__name__} using discord.py app_commands")
+            logger.info("Registering command %s in cog %s using discord.py app_commands", name, cog.__class__.__name__)
             
             # Use discord.py's app_commands
             command_tree = getattr(bot, "tree", None)
@@ -110,11 +109,11 @@ def register_command_in_cog(
                 
                 return function
             else:
-                logger.warning(f"Could not find command tree in bot when registering {name}")
+                logger.warning("Could not find command tree in bot when registering %s", name)
                 return function
         else:
             # Legacy approach
-            logger.info(f"Registering command {name} in cog {cog.__class__.__name__} using legacy method")
+            logger.info("Registering command %s in cog %s using legacy method", name, cog.__class__.__name__)
             
             # Use standard command decorator
             return commands.command(
@@ -123,7 +122,7 @@ def register_command_in_cog(
                 **kwargs
             )(function)
     except Exception as e:
-        logger.error(f"Error registering command {name} in cog {cog.__class__.__name__}: {e}")
+        logger.error("Error registering command %s in cog %s: %s", name, cog.__class__.__name__, e)
         return function
 
 def cog_slash_command(
@@ -201,4 +200,4 @@ class CogWithSlashCommands(commands.Cog):
                     # Store reference to the registered command
                     self.registered_commands.append(registered_command)
                 except Exception as e:
-                    logger.error(f"Error registering slash command {method_name}: {e}")
\ No newline at end of file
+                    logger.error("Error registering slash command %s: %s", method_name, e)
\ No newline at end of file
@@ -15,26 +15,77 @@ import discord
 from discord.ext import commands
 
 from utils.command_imports import (
-    is_compatible_with_pycord_261,
-    get_slash_command_class,
-    get_option_class,
     IS_PYCORD,
     PYCORD_261,
     HAS_APP_COMMANDS
 )
 from utils.interaction_handlers import (
     safely_respond_to_interaction, 
-    get_interaction_user
+    get_interaction_user,
+    HAS_DEFER_METHOD,
+    HAS_RESPONSE_DEFER,
+    HAS_RESPONSE_IS_DONE
 )
 
 logger = logging.getLogger(__name__)
 
+# Library decorators and classes, resolved once at import
+try:
+    from discord.commands import slash_command as _pycord_slash_command
+    from discord.commands import Option as _PycordOption
+except ImportError:
+    _pycord_slash_command = None
+    _PycordOption = None
+
+try:
+    from discord.ext.commands import slash_command as _ext_slash_command
+except ImportError:
+    _ext_slash_command = None
+
+# Where option metadata is stored on command callbacks, and how it is built
+if IS_PYCORD:
+    _OPTIONS_ATTR = "__discord_options__"
+    _make_option = _PycordOption
+elif HAS_APP_COMMANDS:
+    _OPTIONS_ATTR = "__app_commands_options__"
+    _make_option = dict
+else:
+    _OPTIONS_ATTR = None
+    _make_option = None
+
 # Type variables for decorator typing
 CommandT = TypeVar('CommandT', bound=Callable)
 FuncT = TypeVar('FuncT', bound=Callable)
 T = TypeVar('T')
 P = TypeVar('P')
 
+# Leading callback parameters that receive the cog or invocation context, not options
+_CONTEXT_PARAMETER_NAMES = frozenset({"self", "cls", "ctx", "context", "interaction", "inter"})
+
+@functools.lru_cache(maxsize=None)
+def get_command_parameter_names(func: Callable) -> tuple:
+    """
+    Get the parameter names of a command callback, cached per callback
+    
+    Args:
+        func: The command callback
+        
+    Returns:
+        tuple: Parameter names after the leading self/ctx/interaction parameters
+    """
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        # Builtins, partials and other callables without bytecode
+        names = tuple(inspect.signature(func).parameters)
+    else:
+        names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    
+    skip = 0
+    while skip < len(names) and names[skip] in _CONTEXT_PARAMETER_NAMES:
+        skip += 1
+    # With no known name, the first parameter is a differently named context
+    return names[skip or 1:]
+
 async def defer_interaction(interaction_or_ctx: Union[discord.Interaction, commands.Context], ephemeral: bool = False) -> bool:
     """
     Defer an interaction with py-cord 2.6.1 compatibility
@@ -50,13 +101,14 @@ async def defer_interaction(interaction_or_ctx: Union[discord.Interaction, comma
         # Handle different types of interactions/contexts
         if isinstance(interaction_or_ctx, discord.Interaction):
             # Handle Interaction objects
-            if is_compatible_with_pycord_261():
+            if PYCORD_261:
                 # py-cord 2.6.1 uses interaction.response.defer
-                if hasattr(interaction_or_ctx, 'response') and hasattr(interaction_or_ctx.response, 'defer'):
+                if HAS_RESPONSE_DEFER:
+                    response = interaction_or_ctx.response
                     # Check if the interaction is already responded to
-                    if hasattr(interaction_or_ctx.response, 'is_done') and callable(interaction_or_ctx.response.is_done):
-                        if not interaction_or_ctx.response.is_done():
-                            await interaction_or_ctx.response.defer(ephemeral=ephemeral)
+                    if HAS_RESPONSE_IS_DONE:
+                        if not response.is_done():
+                            await response.defer(ephemeral=ephemeral)
                             return True
                         else:
                             logger.debug("Interaction already responded to, skipping defer")
@@ -64,17 +116,17 @@ async def defer_interaction(interaction_or_ctx: Union[discord.Interaction, comma
                     else:
                         # No is_done method, try deferring anyway
                         try:
-                            await interaction_or_ctx.response.defer(ephemeral=ephemeral)
+                            await response.defer(ephemeral=ephemeral)
                             return True
                         except Exception as e:
-                            logger.debug(f"Error deferring interaction: {e}")
+                            logger.debug("Error deferring interaction: %s", e)
                             return False
                 else:
                     logger.warning("Cannot find response.defer on interaction")
                     return False
             else:
                 # Other libraries might use defer directly
-                if hasattr(interaction_or_ctx, 'defer') and callable(interaction_or_ctx.defer):
+                if HAS_DEFER_METHOD:
                     await interaction_or_ctx.defer(ephemeral=ephemeral)
                     return True
                 else:
@@ -82,22 +134,24 @@ async def defer_interaction(interaction_or_ctx: Union[discord.Interaction, comma
                     return False
         elif isinstance(interaction_or_ctx, commands.Context):
             # Handle Context objects
-            if hasattr(interaction_or_ctx, 'defer') and callable(interaction_or_ctx.defer):
-                await interaction_or_ctx.defer()
+            defer = getattr(interaction_or_ctx, 'defer', None)
+            typing = getattr(interaction_or_ctx, 'typing', None)
+            if callable(defer):
+                await defer()
                 return True
-            elif hasattr(interaction_or_ctx, 'typing') and callable(interaction_or_ctx.typing):
+            elif callable(typing):
                 # Use typing as a fallback for regular commands
-                async with interaction_or_ctx.typing():
+                async with typing():
                     pass
                 return True
             else:
                 logger.warning("Cannot find defer or typing method on context")
                 return False
         else:
-            logger.warning(f"Unknown interaction/context type: {type(interaction_or_ctx)}")
+            logger.warning("Unknown interaction/context type: %s", type(interaction_or_ctx))
             return False
     except Exception as e:
-        logger.error(f"Error deferring interaction: {e}")
+        logger.error("Error deferring interaction: %s", e)
         logger.error(traceback.format_exc())
         return False
 
@@ -117,52 +171,23 @@ def enhanced_slash_command(
         Command decorator function
     """
     def decorator(func: CommandT) -> CommandT:
-        if is_compatible_with_pycord_261():
+        if PYCORD_261 and _pycord_slash_command is not None:
             # py-cord 2.6.1 approach
-            # Import locally to avoid circular imports
-            try:
-                from discord.commands import slash_command
-                logger.debug(f"Using py-cord 2.6.1 slash_command for {func.__name__}")
-                
-                # Apply the slash_command decorator with our kwargs
-                return slash_command(**kwargs)(func)
-            except (ImportError, AttributeError) as e:
-                logger.error(f"Error using py-cord 2.6.1 slash_command: {e}")
-                logger.error(traceback.format_exc())
-                
-                # Fallback to the standard commands
-                return commands.command(**kwargs)(func)
-        elif IS_PYCORD:
+            logger.debug("Using py-cord 2.6.1 slash_command for %s", func.__name__)
+            return _pycord_slash_command(**kwargs)(func)
+        elif IS_PYCORD and _ext_slash_command is not None:
             # Regular py-cord approach
-            try:
-                from discord.ext.commands import slash_command
-                logger.debug(f"Using regular py-cord slash_command for {func.__name__}")
-                
-                # Apply the slash_command decorator with our kwargs
-                return slash_command(**kwargs)(func)
-            except (ImportError, AttributeError) as e:
-                logger.error(f"Error using regular py-cord slash_command: {e}")
-                logger.error(traceback.format_exc())
-                
-                # Fallback to the standard commands
-                return commands.command(**kwargs)(func)
+            logger.debug("Using regular py-cord slash_command for %s", func.__name__)
+            return _ext_slash_command(**kwargs)(func)
         elif HAS_APP_COMMANDS:
             # discord.py approach with app_commands
-            try:
-                logger.debug(f"Using discord.py app_commands for {func.__name__}")
-                
-                # Note: discord.py app_commands integration needs to be handled differently
-                # This needs to be registered with the bot's command tree
-                return func
-            except Exception as e:
-                logger.error(f"Error using discord.py app_commands: {e}")
-                logger.error(traceback.format_exc())
-                
-                # Fallback to the standard commands
-                return commands.command(**kwargs)(func)
+            # Note: discord.py app_commands integration needs to be handled differently
+            # This needs to be registered with the bot's command tree
+            logger.debug("Using discord.py app_commands for %s", func.__name__)
+            return func
         else:
             # Fallback to standard command
-            logger.debug(f"Using standard command for {func.__name__}")
+            logger.debug("Using standard command for %s", func.__name__)
             return commands.command(**kwargs)(func)
     
     return decorator
@@ -180,93 +205,28 @@ def option(**kwargs) -> Callable[[FuncT], FuncT]:
         Parameter decorator function
     """
     def decorator(func: FuncT) -> FuncT:
-        if is_compatible_with_pycord_261():
-            # py-cord 2.6.1 approach
-            try:
-                from discord.commands import Option
-                
-                # Store the parameter options in the function's __discord_options__ dict
-                if not hasattr(func, "__discord_options__"):
-                    func.__discord_options__ = {}
-                
-                # Get the parameter name from the name kwarg or infer from next parameter
-                param_name = kwargs.get("name")
-                if not param_name:
-                    # Try to infer the parameter name
-                    sig = inspect.signature(func)
-                    params = list(sig.parameters.values())
-                    
-                    # Find the first parameter without an option (after self/ctx)
-                    for param in params[1:]:  # Skip self/ctx
-                        if param.name not in getattr(func, "__discord_options__", {}):
-                            param_name = param.name
-                            break
-                
-                if param_name:
-                    func.__discord_options__[param_name] = Option(**kwargs)
-                
-                return func
-            except (ImportError, AttributeError) as e:
-                logger.error(f"Error using py-cord 2.6.1 Option: {e}")
-                logger.error(traceback.format_exc())
-                return func
-        elif IS_PYCORD:
-            # Regular py-cord approach
-            try:
-                from discord.commands import Option
-                
-                # Similar to py-cord 2.6.1
-                if not hasattr(func, "__discord_options__"):
-                    func.__discord_options__ = {}
-                
-                param_name = kwargs.get("name")
-                if not param_name:
-                    sig = inspect.signature(func)
-                    params = list(sig.parameters.values())
-                    
-                    for param in params[1:]:
-                        if param.name not in getattr(func, "__discord_options__", {}):
-                            param_name = param.name
-                            break
-                
-                if param_name:
-                    func.__discord_options__[param_name] = Option(**kwargs)
-                
-                return func
-            except (ImportError, AttributeError) as e:
-                logger.error(f"Error using regular py-cord Option: {e}")
-                logger.error(traceback.format_exc())
-                return func
-        elif HAS_APP_COMMANDS:
-            # discord.py app_commands approach
-            try:
-                import discord.app_commands
-                
-                # No direct equivalent, but we can store the info for later
-                if not hasattr(func, "__app_commands_options__"):
-                    func.__app_commands_options__ = {}
-                
-                param_name = kwargs.get("name")
-                if not param_name:
-                    sig = inspect.signature(func)
-                    params = list(sig.parameters.values())
-                    
-                    for param in params[1:]:
-                        if param.name not in getattr(func, "__app_commands_options__", {}):
-                            param_name = param.name
-                            break
-                
-                if param_name:
-                    func.__app_commands_options__[param_name] = kwargs
-                
-                return func
-            except (ImportError, AttributeError) as e:
-                logger.error(f"Error using discord.py app_commands options: {e}")
-                logger.error(traceback.format_exc())
-                return func
-        else:
+        if _make_option is None:
             # No-op for other library versions
             return func
+        
+        stored = getattr(func, _OPTIONS_ATTR, None)
+        if stored is None:
+            stored = {}
+            setattr(func, _OPTIONS_ATTR, stored)
+        
+        # Get the parameter name from the name kwarg or infer from next parameter
+        param_name = kwargs.get("name")
+        if not param_name:
+            # Find the first parameter without an option (after self/ctx)
+            for name in get_command_parameter_names(func):
+                if name not in stored:
+                    param_name = name
+                    break
+        
+        if param_name:
+            stored[param_name] = _make_option(**kwargs)
+        
+        return func
     
     return decorator
 
@@ -283,20 +243,15 @@ def add_parameter_options(func: Callable, options_dict: Dict[str, Any]) -> Calla
     """
     try:
         # Store the options in the function
-        if is_compatible_with_pycord_261() or IS_PYCORD:
-            # py-cord approach
-            if not hasattr(func, "__discord_options__"):
-                func.__discord_options__ = {}
+        if _OPTIONS_ATTR is not None:
+            stored = getattr(func, _OPTIONS_ATTR, None)
+            if stored is None:
+                stored = {}
+                setattr(func, _OPTIONS_ATTR, stored)
             
-            func.__discord_options__.update(options_dict)
-        elif HAS_APP_COMMANDS:
-            # discord.py app_commands approach
-            if not hasattr(func, "__app_commands_options__"):
-                func.__app_commands_options__ = {}
-            
-            func.__app_commands_options__.update(options_dict)
+            stored.update(options_dict)
     except Exception as e:
-        logger.error(f"Error adding parameter options: {e}")
+        logger.error("Error adding parameter options: %s", e)
         logger.error(traceback.format_exc())
     
     return func
@@ -318,34 +273,21 @@ def command_handler(error_logging: bool = True, premium_check: bool = False):
     def decorator(func: CommandT) -> CommandT:
         @functools.wraps(func)
         async def wrapper(self: Any, interaction_or_ctx: Any, *args: Any, **kwargs: Any) -> Any:
-            # Handle different interaction types based on library version
+            # Determine once whether we're dealing with an interaction or context
+            is_interaction = isinstance(interaction_or_ctx, discord.Interaction)
+            
             try:
-                # Determine if we're dealing with an interaction or context
-                is_interaction = isinstance(interaction_or_ctx, discord.Interaction)
-                
-                if is_interaction:
-                    # For interactions, handle library differences
-                    if is_compatible_with_pycord_261():
-                        # py-cord 2.6.1 uses interaction.response
-                        pass  # No special handling needed
-                    else:
-                        # Other libraries might have different behavior
-                        pass
-                
-                # Add user detection with compatibility
-                user = await get_interaction_user(interaction_or_ctx)
-                
-                # Add context to kwargs for the handler to use
+                # Add the invoking user to kwargs for the handler to use
                 if 'user' not in kwargs:
-                    kwargs['user'] = user
+                    kwargs['user'] = getattr(interaction_or_ctx, 'user' if is_interaction else 'author', None)
                 
                 # Call the handler function
                 result = await func(self, interaction_or_ctx, *args, **kwargs)
                 return result
             except Exception as e:
                 if error_logging:
-                    logger.error(f"Error in command handler {func.__name__}: {e}")
-                    logger.error(traceback.format_exc())
+                    # One record carrying the traceback, formatted lazily
+                    logger.exception("Error in command handler %s: %s", func.__name__, e)
                 
                 # Try to respond with an error message
                 try:
@@ -359,7 +301,7 @@ def command_handler(error_logging: bool = True, premium_check: bool = False):
                         if hasattr(interaction_or_ctx, 'reply') and callable(interaction_or_ctx.reply):
                             await interaction_or_ctx.reply(f"An error occurred: {str(e)}")
                 except Exception as response_error:
-                    logger.error(f"Error sending error response: {response_error}")
+                    logger.error("Error sending error response: %s", response_error)
                 
                 # Re-raise the exception for the global error handler
                 raise
@@ -430,7 +372,7 @@ def premium_feature_required(feature_name: Optional[str] = None):
                 # User has premium - proceed with the command
                 return await func(self, *args, **kwargs)
             except Exception as e:
-                logger.error(f"Error in premium check for {func.__name__}: {e}")
+                logger.error("Error in premium check for %s: %s", func.__name__, e)
                 logger.error(traceback.format_exc())
                 
                 # Try to respond with an error
@@ -447,7 +389,7 @@ def premium_feature_required(feature_name: Optional[str] = None):
                             ephemeral=True
                         )
                 except Exception as response_error:
-                    logger.error(f"Error sending premium error response: {response_error}")
+                    logger.error("Error sending premium error response: %s", response_error)
                 
                 # Re-raise the exception for global error handler
                 raise
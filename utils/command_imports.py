@@ -6,8 +6,6 @@ across different versions of py-cord and discord.py.
 """
 
 import logging
-import sys
-import importlib
 from typing import Any, Dict, List, Optional, Union, Type, Tuple, cast
 
 logger = logging.getLogger(__name__)
@@ -15,6 +13,7 @@ logger = logging.getLogger(__name__)
 # Constants for library detection
 IS_PYCORD = False
 PYCORD_VERSION = None
+PYCORD_VERSION_INFO = (0, 0, 0)
 PYCORD_261 = False
 HAS_APP_COMMANDS = False
 
@@ -22,12 +21,37 @@ HAS_APP_COMMANDS = False
 SlashCommand = None
 Option = None
 
+def _parse_version(version: str) -> Tuple[int, int, int]:
+    """
+    Parse a version string into a comparable (major, minor, micro) tuple
+    
+    Args:
+        version: Version string such as "2.6.1" or "2.5.2rc1"
+        
+    Returns:
+        Tuple[int, int, int]: The parsed version, or (0, 0, 0) if unparseable
+    """
+    parts = []
+    for part in version.split(".")[:3]:
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        parts.append(int(digits))
+    if not parts:
+        return (0, 0, 0)
+    parts.extend([0] * (3 - len(parts)))
+    return tuple(parts)
+
 def _setup_imports():
     """
     Setup imports and constants for library detection.
     This function is called at module load time to initialize the constants.
     """
-    global IS_PYCORD, PYCORD_VERSION, PYCORD_261, HAS_APP_COMMANDS
+    global IS_PYCORD, PYCORD_VERSION, PYCORD_VERSION_INFO, PYCORD_261, HAS_APP_COMMANDS
     global SlashCommand, Option
     
     try:
@@ -35,7 +59,7 @@ def _setup_imports():
         
         # Get the version and determine if it's py-cord
         version = getattr(discord, "__version__", "0.0.0")
-        logger.info(f"Detected discord library version: {version}")
+        version_info = _parse_version(version)
         
         # Check if it's py-cord by looking for specific attributes/modules
         try:
@@ -43,10 +67,9 @@ def _setup_imports():
             from discord.ui import Modal
             IS_PYCORD = True
             PYCORD_VERSION = version
-            logger.info(f"Detected py-cord version: {PYCORD_VERSION}")
+            PYCORD_VERSION_INFO = version_info
         except ImportError:
             IS_PYCORD = False
-            logger.info("Not using py-cord")
         
         # Check for py-cord 2.6.1 which misreports itself as 2.5.2
         if IS_PYCORD and version == "2.5.2":
@@ -56,7 +79,6 @@ def _setup_imports():
                 from discord.ui import Modal
                 if hasattr(Modal, "__discord_ui_view__"):
                     PYCORD_261 = True
-                    logger.info("Detected py-cord 2.6.1 compatibility mode")
             except (ImportError, AttributeError):
                 PYCORD_261 = False
         
@@ -64,10 +86,8 @@ def _setup_imports():
         try:
             import discord.app_commands
             HAS_APP_COMMANDS = True
-            logger.info("Detected app_commands module")
         except ImportError:
             HAS_APP_COMMANDS = False
-            logger.info("No app_commands module found")
         
         # Import appropriate command classes based on detected library
         if IS_PYCORD:
@@ -78,7 +98,6 @@ def _setup_imports():
                 
                 SlashCommand = PyCordSlashCommand
                 Option = PyCordOption
-                logger.info("Imported SlashCommand and Option from py-cord 2.6.1")
             else:
                 # Regular py-cord
                 from discord.ext.commands import SlashCommand as PyCordSlashCommand
@@ -86,7 +105,6 @@ def _setup_imports():
                 
                 SlashCommand = PyCordSlashCommand
                 Option = PyCordOption
-                logger.info("Imported SlashCommand and Option from regular py-cord")
         elif HAS_APP_COMMANDS:
             # discord.py style
             from discord.ext.commands import Command as DiscordPyCommand
@@ -99,7 +117,6 @@ def _setup_imports():
                 pass
                 
             Option = DiscordPyOption
-            logger.info("Using compatibility classes for discord.py")
         else:
             # Fallback for older versions
             from discord.ext.commands import Command
@@ -107,14 +124,14 @@ def _setup_imports():
             # Use base Command class as placeholders
             SlashCommand = Command
             Option = object
-            logger.info("Using fallback Command class for older discord.py")
             
     except ImportError as e:
-        logger.error(f"Error during import setup: {e}")
+        logger.error("Error during import setup: %s", e)
         
         # Set fallback values
         IS_PYCORD = False
         PYCORD_VERSION = None
+        PYCORD_VERSION_INFO = (0, 0, 0)
         PYCORD_261 = False
         HAS_APP_COMMANDS = False
         SlashCommand = None
@@ -166,4 +183,16 @@ def get_option_class() -> Optional[Type]:
     return Option
 
 # Initialize the module when imported
-_setup_imports()
\ No newline at end of file
+_setup_imports()
+if logger.isEnabledFor(logging.INFO):
+    logger.info(
+        "Discord compat detected: %s",
+        {
+            "is_pycord": IS_PYCORD,
+            "version": PYCORD_VERSION,
+            "pycord_261": PYCORD_261,
+            "has_app_commands": HAS_APP_COMMANDS,
+            "slash_command": getattr(SlashCommand, "__qualname__", SlashCommand),
+            "option": getattr(Option, "__qualname__", Option),
+        }
+    )
\ No newline at end of file
@@ -5,7 +5,10 @@ This module provides a unified interface for command registration and synchroniz
 handling the differences between py-cord 2.6.1 and other Discord library versions.
 """
 
+import functools
+import json
 import logging
+import time
 import traceback
 from typing import Any, Dict, List, Optional, Union, Callable, cast
 
@@ -13,13 +16,28 @@ import discord
 from discord.ext import commands
 
 from utils.command_imports import (
-    is_compatible_with_pycord_261,
     PYCORD_261,
     HAS_APP_COMMANDS
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds an unchanged command set is considered synced for a guild (or globally)
+SYNC_CACHE_TTL = 300
+
+@functools.lru_cache(maxsize=512)
+def _guild_object(guild_id: int) -> discord.Object:
+    """
+    Get a shared discord.Object handle for a guild ID
+    
+    Args:
+        guild_id: The guild ID
+        
+    Returns:
+        discord.Object: Snowflake handle for the guild
+    """
+    return discord.Object(id=guild_id)
+
 class CompatibilityCommandTree:
     """
     Unified command tree interface for py-cord 2.6.1 compatibility
@@ -37,9 +55,11 @@ class CompatibilityCommandTree:
         """
         self.bot = bot
         self._commands = []
+        # guild ID (None for global) -> (command signature, monotonic sync time)
+        self._sync_cache = {}
         
         # Store reference to native command tree based on library
-        if is_compatible_with_pycord_261():
+        if PYCORD_261:
             # py-cord 2.6.1 has tree attribute
             self._native_tree = getattr(bot, "tree", None)
         elif HAS_APP_COMMANDS:
@@ -49,7 +69,7 @@ class CompatibilityCommandTree:
             # Fallback for older versions
             self._native_tree = None
             
-        logger.info(f"Initialized command tree with py-cord 2.6.1 compatibility mode: {is_compatible_with_pycord_261()}")
+        logger.info("Initialized command tree with py-cord 2.6.1 compatibility mode: %s", PYCORD_261)
     
     def add_command(
         self, 
@@ -76,17 +96,17 @@ class CompatibilityCommandTree:
         command_name = name or getattr(command, "__name__", "unknown_command")
         
         try:
-            if is_compatible_with_pycord_261():
+            if PYCORD_261:
                 # py-cord 2.6.1 approach
                 if self._native_tree:
-                    logger.debug(f"Registering command {command_name} with py-cord 2.6.1 tree")
+                    logger.debug("Registering command %s with py-cord 2.6.1 tree", command_name)
                     
                     # Check if we need to register to specific guilds
                     if guild_ids:
                         # Register to each guild
                         for guild_id in guild_ids:
                             try:
-                                guild = discord.Object(id=guild_id)
+                                guild = _guild_object(guild_id)
                                 registered = self._native_tree.command(
                                     name=command_name,
                                     description=description or getattr(command, "__doc__", "No description"),
@@ -95,7 +115,7 @@ class CompatibilityCommandTree:
                                 )(command)
                                 self._commands.append(registered)
                             except Exception as e:
-                                logger.error(f"Error registering guild command {command_name} for guild {guild_id}: {e}")
+                                logger.error("Error registering guild command %s for guild %s: %s", command_name, guild_id, e)
                     else:
                         # Register globally
                         registered = self._native_tree.command(
@@ -111,7 +131,7 @@ class CompatibilityCommandTree:
             elif HAS_APP_COMMANDS:
                 # discord.py approach
                 if self._native_tree:
-                    logger.debug(f"Registering command {command_name} with discord.py tree")
+                    logger.debug("Registering command %s with discord.py tree", command_name)
                     
                     # Similar approach to py-cord but with discord.py specifics
                     if guild_ids:
@@ -119,7 +139,7 @@ class CompatibilityCommandTree:
                             registered = self._native_tree.command(
                                 name=command_name,
                                 description=description or getattr(command, "__doc__", "No description"),
-                                guild=discord.Object(id=guild_id),
+                                guild=_guild_object(guild_id),
                                 **kwargs
                             )(command)
                             self._commands.append(registered)
@@ -136,7 +156,7 @@ class CompatibilityCommandTree:
                     logger.warning("No native command tree found for discord.py")
             else:
                 # Fallback approach for older libraries
-                logger.debug(f"Registering command {command_name} using fallback approach")
+                logger.debug("Registering command %s using fallback approach", command_name)
                 
                 # Use basic command decorator
                 registered = commands.command(
@@ -151,10 +171,57 @@ class CompatibilityCommandTree:
                 
                 return registered
         except Exception as e:
-            logger.error(f"Error registering command {command_name}: {e}")
+            logger.error("Error registering command %s: %s", command_name, e)
             logger.error(traceback.format_exc())
             return command
     
+    @staticmethod
+    def _command_payload(command: Any) -> str:
+        """
+        Serialize the parts of a command that Discord stores
+        
+        Args:
+            command: The command to serialize
+            
+        Returns:
+            str: The command's payload as canonical JSON
+        """
+        to_dict = getattr(command, "to_dict", None)
+        if callable(to_dict):
+            payload = to_dict()
+        else:
+            payload = {
+                "name": getattr(command, "name", ""),
+                "description": getattr(command, "description", "") or "",
+                "options": [
+                    opt.to_dict() if callable(getattr(opt, "to_dict", None)) else getattr(opt, "name", opt)
+                    for opt in (getattr(command, "options", None) or ())
+                ],
+            }
+        return json.dumps(payload, sort_keys=True, default=str)
+    
+    def _command_signature(self, guild: Optional[discord.Guild] = None) -> Optional[int]:
+        """
+        Hash the full payloads (options, types, choices, permissions) of the commands to sync
+        
+        Args:
+            guild: Optional guild whose commands to hash, if None hashes global commands
+            
+        Returns:
+            int or None: The signature, or None if the commands couldn't be listed
+        """
+        try:
+            get_commands = getattr(self._native_tree, "get_commands", None)
+            if callable(get_commands):
+                tree_commands = get_commands(guild=guild) if guild else get_commands()
+            else:
+                tree_commands = self._commands
+            
+            return hash(tuple(sorted(self._command_payload(command) for command in tree_commands)))
+        except Exception as e:
+            logger.debug("Could not compute command signature: %s", e)
+            return None
+    
     async def sync(self, guild: Optional[discord.Guild] = None) -> bool:
         """
         Sync commands to Discord
@@ -169,29 +236,46 @@ class CompatibilityCommandTree:
             if self._native_tree is None:
                 logger.warning("No native command tree to sync")
                 return False
+            
+            # Skip the API call if this command set was synced recently
+            guild_key = getattr(guild, "id", None)
+            signature = self._command_signature(guild)
+            cached = self._sync_cache.get(guild_key)
+            if (
+                signature is not None
+                and cached is not None
+                and cached[0] == signature
+                and time.monotonic() - cached[1] < SYNC_CACHE_TTL
+            ):
+                logger.debug("Commands unchanged since last sync %s, skipping", 'to guild' if guild else 'globally')
+                return True
                 
-            if is_compatible_with_pycord_261():
+            if PYCORD_261:
                 # py-cord 2.6.1 approach
-                logger.info(f"Syncing commands with py-cord 2.6.1 {'to guild' if guild else 'globally'}")
+                logger.info("Syncing commands with py-cord 2.6.1 %s", 'to guild' if guild else 'globally')
                 
                 # Use the native tree's sync method
                 await self._native_tree.sync(guild=guild)
+                if signature is not None:
+                    self._sync_cache[guild_key] = (signature, time.monotonic())
                 return True
             elif HAS_APP_COMMANDS:
                 # discord.py approach
-                logger.info(f"Syncing commands with discord.py {'to guild' if guild else 'globally'}")
+                logger.info("Syncing commands with discord.py %s", 'to guild' if guild else 'globally')
                 
                 if guild:
                     await self._native_tree.sync(guild=guild)
                 else:
                     await self._native_tree.sync()
+                if signature is not None:
+                    self._sync_cache[guild_key] = (signature, time.monotonic())
                 return True
             else:
                 # No sync needed for older command systems
                 logger.info("No command sync required for this library version")
                 return True
         except Exception as e:
-            logger.error(f"Error syncing commands: {e}")
+            logger.error("Error syncing commands: %s", e)
             logger.error(traceback.format_exc())
             return False
 
@@ -245,12 +329,12 @@ async def sync_command_tree(
                         
                         # Get guild name safely
                         guild_name = getattr(guild, "name", str(guild_id))
-                        logger.info(f"Synced commands to guild {guild_name} ({guild_id})")
+                        logger.info("Synced commands to guild %s (%s)", guild_name, guild_id)
                     else:
-                        logger.warning(f"Could not find guild with ID {guild_id}")
+                        logger.warning("Could not find guild with ID %s", guild_id)
                         sync_results.append(False)
                 except Exception as e:
-                    logger.error(f"Error syncing commands to guild {guild_id}: {e}")
+                    logger.error("Error syncing commands to guild %s: %s", guild_id, e)
                     logger.error(traceback.format_exc())
                     sync_results.append(False)
         
@@ -261,13 +345,13 @@ async def sync_command_tree(
                 sync_results.append(result)
                 logger.info("Application commands synced globally")
             except Exception as e:
-                logger.error(f"Error syncing commands globally: {e}")
+                logger.error("Error syncing commands globally: %s", e)
                 logger.error(traceback.format_exc())
                 sync_results.append(False)
                 
         # Overall success if at least one sync operation succeeded
         return any(sync_results) if sync_results else False
     except Exception as e:
-        logger.error(f"Error in sync_command_tree: {e}")
+        logger.error("Error in sync_command_tree: %s", e)
         logger.error(traceback.format_exc())
         return False
\ No newline at end of file
@@ -13,6 +13,9 @@ from typing import Any, Callable, Dict, List, Optional, Type, Union, get_type_hi
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
 def get_parent_method_signature(cls: Type, method_name: str) -> Optional[Dict[str, Any]]:
     """
     Get the signature of a method from the parent class.
@@ -53,7 +56,7 @@ def patch_method_signature(cls: Type, method_name: str) -> bool:
         bool: True if patched successfully, False otherwise
     """
     if not hasattr(cls, method_name):
-        logger.error(f"Class {cls.__name__} has no method named {method_name}")
+        logger.error("Class %s has no method named %s", cls.__name__, method_name)
         return False
     
     # Get the method we want to update
@@ -62,7 +65,7 @@ def patch_method_signature(cls: Type, method_name: str) -> bool:
     # Get parent method signature
     parent_sig = get_parent_method_signature(cls, method_name)
     if not parent_sig:
-        logger.error(f"Could not find parent signature for {method_name}")
+        logger.error("Could not find parent signature for %s", method_name)
         return False
     
     # Create a wrapper that maintains the correct signature
@@ -81,7 +84,7 @@ def patch_method_signature(cls: Type, method_name: str) -> bool:
         setattr(cls, method_name, wrapper)
         return True
     except Exception as e:
-        logger.error(f"Failed to patch method {method_name}: {e}")
+        logger.error("Failed to patch method %s: %s", method_name, e)
         return False
 
 def make_compatible_with_parent(cls: Type, method_names: List[str]) -> Dict[str, bool]:
@@ -117,32 +120,7 @@ class SlashCommandOptionParser:
         Returns:
             Dict mapping option names to values
         """
-        result = {}
-        
-        # Handle list-style options (newer py-cord)
-        if isinstance(options, list):
-            for option in options:
-                if hasattr(option, 'name') and hasattr(option, 'value'):
-                    result[option.name] = option.value
-                elif isinstance(option, dict) and 'name' in option and 'value' in option:
-                    result[option['name']] = option['value']
-                    
-        # Handle dict-style options (older versions)
-        elif hasattr(options, 'items') and callable(options.items):
-            for name, value in options.items():
-                result[name] = value
-                
-        # Handle dict-like objects without an items() method
-        elif hasattr(options, 'get') and callable(options.get):
-            # Try to extract options by common attribute names
-            for key in ['options', 'values', 'parameters']:
-                opts = options.get(key)
-                if opts:
-                    # Recursively parse these options
-                    sub_results = SlashCommandOptionParser.parse_options(opts)
-                    result.update(sub_results)
-        
-        return result
+        return safely_parse_options(options)
 
 class PatternedChoice:
     """
@@ -233,7 +211,7 @@ def create_command_tree(bot_instance):
     logger.info("Creating command tree for bot instance")
     
     # Determine library version and approach
-    logger.info(f"Discord library version: {discord.__version__}")
+    logger.info("Discord library version: %s", discord.__version__)
     
     # For py-cord 2.6.1+, we just need to return the bot instance
     # since it directly handles commands without a separate tree
@@ -253,37 +231,71 @@ def create_command_tree(bot_instance):
         except (ImportError, ModuleNotFoundError):
             logger.debug("discord.app_commands module not found")
     except Exception as e:
-        logger.error(f"Failed to import command tree: {e}")
+        logger.error("Failed to import command tree: %s", e)
     
     # Last resort: return the bot instance itself
     logger.warning("Using bot instance directly as command tree fallback")
     return bot_instance
 
-def safely_parse_options(options):
+def _parse_option_list(options, result):
     """
-    Safely parse command options, handling both list and dict-like objects for compatibility.
+    Collect list-style options (py-cord 2.6.1+) into result.
     
-    This helper function can work with both:
-    - List-style options from newer py-cord (2.6.1+)
-    - Dictionary-style options from older py-cord/discord.py
+    Args:
+        options: Sequence of option objects or {'name', 'value'} dicts
+        result: Dict to store option names and values in
+    """
+    # Local bindings keep the per-option lookups off the globals/builtins
+    _getattr = getattr
+    missing = _MISSING
+    for option in options:
+        # Extract name and value using attribute access if possible
+        name = _getattr(option, 'name', missing)
+        value = _getattr(option, 'value', missing)
+        if name is not missing and value is not missing:
+            result[name] = value
+        # Fallback to dictionary access if needed
+        elif isinstance(option, dict) and 'name' in option and 'value' in option:
+            result[option['name']] = option['value']
+
+def _parse_option_dict(options, result):
+    """
+    Collect dict-style options (older versions) into result.
+    
+    Args:
+        options: Dict mapping option names to values
+        result: Dict to store option names and values in
+    """
+    result.update(options)
+
+# Parsers for the exact container types option payloads normally arrive as
+_OPTION_PARSERS = {
+    list: _parse_option_list,
+    tuple: _parse_option_list,
+    dict: _parse_option_dict,
+}
+
+def _collect_options(options, result, visited):
+    """
+    Collect options into result, parsing nested containers depth-first.
     
     Args:
         options: The options object (list or dict-like)
-        
-    Returns:
-        Dict mapping option names to values
+        result: Dict to store option names and values in
+        visited: Ids of containers already parsed, so self-references can't loop
     """
-    result = {}
+    if id(options) in visited:
+        return
+    visited.add(id(options))
     
-    # Handle list-style options (py-cord 2.6.1+)
-    if isinstance(options, list):
-        for option in options:
-            # Extract name and value using attribute access if possible
-            if hasattr(option, 'name') and hasattr(option, 'value'):
-                result[option.name] = option.value
-            # Fallback to dictionary access if needed
-            elif isinstance(option, dict) and 'name' in option and 'value' in option:
-                result[option['name']] = option['value']
+    # Exact built-in container types dispatch straight to their parser
+    parser = _OPTION_PARSERS.get(type(options))
+    if parser is not None:
+        parser(options, result)
+    
+    # Handle list subclasses (py-cord 2.6.1+)
+    elif isinstance(options, list):
+        _parse_option_list(options, result)
     
     # Handle dict-style options (older versions)
     elif hasattr(options, 'items') and callable(options.items):
@@ -292,7 +304,7 @@ def safely_parse_options(options):
                 result[name] = value
         except (TypeError, AttributeError) as e:
             # Log the error and try a different approach
-            logger.debug(f"Error using items(): {e}")
+            logger.debug("Error using items(): %s", e)
             
             # Try dictionary-style access as fallback
             if hasattr(options, 'keys') and callable(options.keys):
@@ -305,15 +317,35 @@ def safely_parse_options(options):
     # Handle other types of objects by attempting attribute extraction
     else:
         # Try common attribute names that might contain options
-        for key in ['options', 'values', 'parameters']:
-            if hasattr(options, key):
-                try:
-                    value = getattr(options, key)
-                    # Recursively parse if we got another container
-                    if isinstance(value, (list, dict)) or hasattr(value, 'items'):
-                        sub_results = safely_parse_options(value)
-                        result.update(sub_results)
-                except Exception:
-                    pass
-    
-    return result
\ No newline at end of file
+        for key in ('options', 'values', 'parameters'):
+            try:
+                value = getattr(options, key, _MISSING)
+                # Recursively parse if we got another container
+                if value is not _MISSING and (isinstance(value, (list, dict)) or hasattr(value, 'items')):
+                    _collect_options(value, result, visited)
+            except Exception:
+                pass
+
+def safely_parse_options(options):
+    """
+    Safely parse command options, handling both list and dict-like objects for compatibility.
+    
+    This helper function can work with both:
+    - List-style options from newer py-cord (2.6.1+)
+    - Dictionary-style options from older py-cord/discord.py
+    
+    Args:
+        options: The options object (list or dict-like)
+        
+    Returns:
+        Dict mapping option names to values
+    """
+    if not options:
+        return {}
+    if type(options) is dict:
+        # Copy so callers can't mutate the original payload through the result
+        return dict(options)
+    
+    result = {}
+    _collect_options(options, result, set())
+    return result
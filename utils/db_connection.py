@@ -17,9 +17,15 @@ logger = logging.getLogger(__name__)
 MONGODB_URI = os.environ.get("MONGODB_URI", "mongodb://localhost:27017/discordbot")
 DB_NAME = os.environ.get("DB_NAME", "discordbot")
 
+# Connection pool settings for the shared client
+MONGODB_MAX_POOL_SIZE = int(os.environ.get("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.environ.get("MONGODB_MIN_POOL_SIZE", "0"))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+
 # Connection and DB instances
 _mongo_client = None
 _db = None
+_connect_lock: Optional[asyncio.Lock] = None
 
 # Type for database
 T = TypeVar('T')
@@ -32,34 +38,43 @@ async def get_db_connection():
     Returns:
         MongoDB database object or None if connection fails
     """
-    global _mongo_client, _db
+    global _mongo_client, _db, _connect_lock
     
     if _db is not None:
         return _db
+    
+    # Serialize first-time setup so concurrent callers share one client
+    if _connect_lock is None:
+        _connect_lock = asyncio.Lock()
+    
+    async with _connect_lock:
+        if _db is not None:
+            return _db
         
-    try:
-        # Create client if not exists
-        if _mongo_client is None:
-            logger.debug("Creating new MongoDB client")
-            _mongo_client = motor.motor_asyncio.AsyncIOMotorClient(
-                MONGODB_URI,
-                serverSelectionTimeoutMS=5000
-            )
-        
-        # Get database
-        _db = _mongo_client[DB_NAME]
-        
-        # Verify connection with a ping
-        await _mongo_client.admin.command('ping')
-        logger.debug("MongoDB connection successful")
-        
-        return _db
-        
-    except Exception as e:
-        logger.error(f"Error connecting to MongoDB: {e}")
-        _mongo_client = None
-        _db = None
-        return None
+        try:
+            # Create client if not exists
+            if _mongo_client is None:
+                logger.debug("Creating new MongoDB client")
+                _mongo_client = motor.motor_asyncio.AsyncIOMotorClient(
+                    MONGODB_URI,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=MONGODB_MIN_POOL_SIZE,
+                    waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS
+                )
+            
+            # Verify connection with a ping before publishing the database
+            await _mongo_client.admin.command('ping')
+            logger.debug("MongoDB connection successful")
+            
+            _db = _mongo_client[DB_NAME]
+            return _db
+            
+        except Exception as e:
+            logger.error(f"Error connecting to MongoDB: {e}")
+            _mongo_client = None
+            _db = None
+            return None
 
 
 async def close_db_connection():
@@ -16,6 +16,7 @@ import asyncio
 import time
 import functools
 import traceback
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import (
     Callable, Optional, List, Dict, Any, Union, TypeVar, 
@@ -49,7 +50,8 @@ SlashCommandT = TypeVar('SlashCommandT', bound=Callable[..., Coroutine[Any, Any,
 
 # Cache configuration
 COMMAND_GUILD_CACHE_TTL = 60  # 1 minute
-COMMAND_COOLDOWNS = {}  # Map of user IDs to command timestamp
+COMMAND_COOLDOWNS = OrderedDict()  # Map of (user ID, command name) to monotonic timestamp
+MAX_COOLDOWN_ENTRIES = 4096  # Oldest cooldown entries are evicted beyond this size
 ERROR_TRACKING = {}  # Map of command names to error counts
 COMMAND_METRICS = {}  # Map of command names to metrics (invoke count, avg runtime)
 
@@ -781,6 +783,33 @@ def check_server_limit():
     return decorator
 
 
+async def _send_command_error(
+    ctx: Optional[commands.Context],
+    interaction: Optional[discord.Interaction],
+    message: str
+):
+    """
+    Send a command_handler error message to whichever context invoked the command.
+
+    Args:
+        ctx: Context of a traditional command, or None
+        interaction: Interaction of an application command, or None
+        message: Error message to send
+    """
+    try:
+        if ctx:
+            await ctx.send(message)
+        elif interaction:
+            # Check if interaction is already responded to
+            if interaction.response:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(message, ephemeral=True)
+                else:
+                    await interaction.followup.send(message, ephemeral=True)
+    except Exception as e:
+        logger.error(f"Error sending command error message: {e}")
+
+
 def command_handler(
     premium_feature: Optional[str] = None, 
     server_id_param: Optional[str] = None,
@@ -837,6 +866,10 @@ def command_handler(
     if error_messages is not None:
         messages.update(error_messages)
 
+    # Resolve which optional checks are enabled once, at decoration time
+    enforce_guild_only = bool(guild_only_command)
+    enforce_server_limits = bool(check_server_limits)
+
     def decorator(func: CommandT) -> CommandT:
         command_name = func.__name__
 
@@ -845,8 +878,9 @@ def command_handler(
             start_time = time.time()
 
             # Initialize tracking for this command if needed
-            if command_name not in COMMAND_METRICS:
-                COMMAND_METRICS[command_name] = {
+            metrics = COMMAND_METRICS.get(command_name)
+            if metrics is None:
+                metrics = COMMAND_METRICS[command_name] = {
                     "invocations": 0,
                     "errors": 0,
                     "avg_runtime": 0,
@@ -855,7 +889,7 @@ def command_handler(
                 }
 
             # Increment invocation counter
-            COMMAND_METRICS[command_name]["invocations"] += 1
+            metrics["invocations"] += 1
 
             # Extract command context
             ctx = None
@@ -901,43 +935,31 @@ def command_handler(
                     traceback.print_exc()
                     return None
 
-            # Helper function to send error messages
-            async def send_error(message: str):
-                try:
-                    if is_traditional and ctx:
-                        await ctx.send(message)
-                    elif is_app_command and interaction:
-                        # Check if interaction is already responded to
-                        if interaction and interaction.response:
-                            if not interaction.response.is_done():
-                                await interaction.response.send_message(message, ephemeral=True)
-                            else:
-                                await interaction.followup.send(message, ephemeral=True)
-                except Exception as e:
-                    logger.error(f"Error sending command error message: {e}")
-
             # 1. Check if we're in a guild (if required)
-            if guild_only_command is not None and not guild_id:
-                await send_error(messages["dm_context"])
+            if enforce_guild_only and not guild_id:
+                await _send_command_error(ctx, interaction, messages["dm_context"])
                 return None
 
             # 2. Apply cooldown if specified
             if cooldown_seconds and user_id:
-                user_key = f"{user_id}:{command_name}"
-                now = time.time()
+                user_key = (user_id, command_name)
+                now = time.monotonic()
 
-                if user_key in COMMAND_COOLDOWNS:
-                    last_use = COMMAND_COOLDOWNS[user_key]
+                last_use = COMMAND_COOLDOWNS.get(user_key)
+                if last_use is not None:
                     time_diff = now - last_use
 
                     if time_diff < cooldown_seconds:
                         remaining = int(cooldown_seconds - time_diff)
                         cooldown_msg = messages["cooldown"].format(seconds=remaining)
-                        await send_error(cooldown_msg)
+                        await _send_command_error(ctx, interaction, cooldown_msg)
                         return None
 
-                # Update cooldown timestamp
+                # Update cooldown timestamp, keeping the map bounded
                 COMMAND_COOLDOWNS[user_key] = now
+                COMMAND_COOLDOWNS.move_to_end(user_key)
+                if len(COMMAND_COOLDOWNS) > MAX_COOLDOWN_ENTRIES:
+                    COMMAND_COOLDOWNS.popitem(last=False)
 
             # Skip remaining checks if no guild (already passed guild_only check)
             if guild_id is None or guild_id == "":
@@ -946,21 +968,20 @@ def command_handler(
 
                     # Update metrics
                     runtime = time.time() - start_time
-                    metrics = COMMAND_METRICS[command_name]
                     metrics["avg_runtime"] = (metrics["avg_runtime"] * (metrics["invocations"] - 1) + runtime) / metrics["invocations"]
 
                     return result
                 except Exception as e:
                     # Track error
-                    COMMAND_METRICS[command_name]["errors"] += 1
-                    COMMAND_METRICS[command_name]["last_error"] = str(e)
-                    COMMAND_METRICS[command_name]["success_rate"] = (
-                        (COMMAND_METRICS[command_name]["invocations"] - COMMAND_METRICS[command_name]["errors"]) / 
-                        max(1, COMMAND_METRICS[command_name]["invocations"])
+                    metrics["errors"] += 1
+                    metrics["last_error"] = str(e)
+                    metrics["success_rate"] = (
+                        (metrics["invocations"] - metrics["errors"]) / 
+                        max(1, metrics["invocations"])
                     )
 
                     logger.error(f"Error in command {command_name}: {e}")
-                    await send_error(messages["unknown_error"])
+                    await _send_command_error(ctx, interaction, messages["unknown_error"])
                     return None
 
             # 3. Get guild model (needed for all remaining checks)
@@ -985,7 +1006,7 @@ def command_handler(
                     logger.warning(f"Database not available for guild model lookup: {string_guild_id}")
             except Exception as e:
                 logger.error(f"Database error getting guild model: {e}")
-                await send_error(messages["database_error"])
+                await _send_command_error(ctx, interaction, messages["database_error"])
                 return None
 
             # Enhanced handling for premium validation
@@ -996,7 +1017,7 @@ def command_handler(
                     has_access, error_message = await validate_premium_feature(guild_model, premium_feature)
                     if has_access is None:
                         if error_message is not None:
-                            await send_error(error_message)
+                            await _send_command_error(ctx, interaction, error_message)
                         return None
                 else:
                     # If guild_model doesn't exist, check premium tier directly
@@ -1030,32 +1051,32 @@ def command_handler(
                                     guild_model = await Guild.get_or_create(db, guild_id)
                                     if guild_model is None:
                                         # If still can't create guild, show setup message for server features
-                                        await send_error(messages["guild_not_found"])
+                                        await _send_command_error(ctx, interaction, messages["guild_not_found"])
                                         return None
                                 except Exception as e:
                                     logger.error(f"Error creating guild model on-the-fly: {e}")
-                                    await send_error(messages["guild_not_found"])
+                                    await _send_command_error(ctx, interaction, messages["guild_not_found"])
                                     return None
                         else:
                             # Premium check failed, return error message
                             if error_message is not None:
-                                await send_error(error_message)
+                                await _send_command_error(ctx, interaction, error_message)
                             return None
                     else:
                         # Feature not found in any tier, show guild setup message
-                        await send_error(messages["guild_not_found"])
+                        await _send_command_error(ctx, interaction, messages["guild_not_found"])
                         return None
             elif guild_model is None:
                 # No premium check but guild model required - show standard error
-                await send_error(messages["guild_not_found"])
+                await _send_command_error(ctx, interaction, messages["guild_not_found"])
                 return None
 
             # 5. Check server limits
-            if check_server_limits is not None:
+            if enforce_server_limits:
                 has_capacity, error_message = await validate_server_limit(guild_model)
                 if has_capacity is None:
                     if error_message is not None:
-                        await send_error(error_message)
+                        await _send_command_error(ctx, interaction, error_message)
                     return None
 
             # 6. Validate server ID if specified
@@ -1082,7 +1103,7 @@ def command_handler(
 
                     # Validate server format
                     if not validate_server_id_format(server_id):
-                        await send_error(f"Invalid server ID format: {server_id}")
+                        await _send_command_error(ctx, interaction, f"Invalid server ID format: {server_id}")
                         return None
 
                     # Validate server exists and belongs to this guild
@@ -1090,17 +1111,17 @@ def command_handler(
                         # Check guild isolation
                         isolation_valid = await enforce_guild_isolation(db, server_id, guild_id)
                         if isolation_valid is None:
-                            await send_error(f"Server '{server_id}' does not belong to this Discord server.")
+                            await _send_command_error(ctx, interaction, f"Server '{server_id}' does not belong to this Discord server.")
                             return None
 
                         # Check server existence
                         server = await get_server_safely(db, server_id, guild_id)
                         if server is None:
-                            await send_error(f"Server '{server_id}' not found. Use `/list_servers` to see available servers.")
+                            await _send_command_error(ctx, interaction, f"Server '{server_id}' not found. Use `/list_servers` to see available servers.")
                             return None
                     except Exception as e:
                         logger.error(f"Error validating server {server_id}: {e}")
-                        await send_error(f"Error validating server: {e}")
+                        await _send_command_error(ctx, interaction, f"Error validating server: {e}")
                         return None
 
             # All checks passed, run the command with error handling and timeout protection
@@ -1110,12 +1131,11 @@ def command_handler(
 
             # Track if we're about to execute a command that's been problematic
             is_problematic = False
-            if command_name in COMMAND_METRICS:
-                if COMMAND_METRICS[command_name]["invocations"] > 5:
-                    success_rate = COMMAND_METRICS[command_name]["success_rate"]
-                    if success_rate < 0.75:  # Less than 75% success rate
-                        is_problematic = True
-                        logger.warning(f"Executing problematic command {command_name} with historical success rate of {success_rate:.1%}")
+            if metrics["invocations"] > 5:
+                success_rate = metrics["success_rate"]
+                if success_rate < 0.75:  # Less than 75% success rate
+                    is_problematic = True
+                    logger.warning(f"Executing problematic command {command_name} with historical success rate of {success_rate:.1%}")
 
             while retry_attempts <= retry_count:
                 try:
@@ -1137,7 +1157,6 @@ def command_handler(
 
                     # Command succeeded, update metrics
                     runtime = time.time() - start_time
-                    metrics = COMMAND_METRICS[command_name]
                     metrics["avg_runtime"] = (metrics["avg_runtime"] * (metrics["invocations"] - 1) + runtime) / metrics["invocations"]
                     metrics["success_rate"] = (
                         (metrics["invocations"] - metrics["errors"]) / 
@@ -1163,15 +1182,15 @@ def command_handler(
 
                     # If this is the last retry, report the error
                     if retry_attempts > retry_count:
-                        COMMAND_METRICS[command_name]["errors"] += 1
-                        COMMAND_METRICS[command_name]["last_error"] = "Command timed out"
-                        COMMAND_METRICS[command_name]["success_rate"] = (
-                            (COMMAND_METRICS[command_name]["invocations"] - COMMAND_METRICS[command_name]["errors"]) / 
-                            max(1, COMMAND_METRICS[command_name]["invocations"])
+                        metrics["errors"] += 1
+                        metrics["last_error"] = "Command timed out"
+                        metrics["success_rate"] = (
+                            (metrics["invocations"] - metrics["errors"]) / 
+                            max(1, metrics["invocations"])
                         )
 
                         logger.error(f"Command {command_name} timed out after {retry_count+1} attempts")
-                        await send_error(f"{messages['timeout']} (after {retry_count+1} attempts)")
+                        await _send_command_error(ctx, interaction, f"{messages['timeout']} (after {retry_count+1} attempts)")
                         return None
 
                     # Otherwise wait briefly before retry
@@ -1185,15 +1204,15 @@ def command_handler(
 
                     # If this is the last retry, report the error
                     if retry_attempts > retry_count:
-                        COMMAND_METRICS[command_name]["errors"] += 1
-                        COMMAND_METRICS[command_name]["last_error"] = f"Network error: {e}"
-                        COMMAND_METRICS[command_name]["success_rate"] = (
-                            (COMMAND_METRICS[command_name]["invocations"] - COMMAND_METRICS[command_name]["errors"]) / 
-                            max(1, COMMAND_METRICS[command_name]["invocations"])
+                        metrics["errors"] += 1
+                        metrics["last_error"] = f"Network error: {e}"
+                        metrics["success_rate"] = (
+                            (metrics["invocations"] - metrics["errors"]) / 
+                            max(1, metrics["invocations"])
                         )
 
                         logger.error(f"Network error in command {command_name} after {retry_count+1} attempts: {e}")
-                        await send_error("Network error occurred. Please try again later.")
+                        await _send_command_error(ctx, interaction, "Network error occurred. Please try again later.")
                         return None
 
                     # Otherwise wait briefly before retry
@@ -1201,11 +1220,11 @@ def command_handler(
 
                 except Exception as e:
                     # Non-transient errors, don't retry
-                    COMMAND_METRICS[command_name]["errors"] += 1
-                    COMMAND_METRICS[command_name]["last_error"] = str(e)
-                    COMMAND_METRICS[command_name]["success_rate"] = (
-                        (COMMAND_METRICS[command_name]["invocations"] - COMMAND_METRICS[command_name]["errors"]) / 
-                        max(1, COMMAND_METRICS[command_name]["invocations"])
+                    metrics["errors"] += 1
+                    metrics["last_error"] = str(e)
+                    metrics["success_rate"] = (
+                        (metrics["invocations"] - metrics["errors"]) / 
+                        max(1, metrics["invocations"])
                     )
 
                     error_details = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
@@ -1233,7 +1252,7 @@ def command_handler(
                         user_message = f"{messages['unknown_error']} Error: {e}"
 
                     # Send the error message to the user
-                    await send_error(user_message)
+                    await _send_command_error(ctx, interaction, user_message)
                     return None
 
         # Update wrapper attributes for introspection
@@ -28,6 +28,11 @@ async def send_safely(ctx, embed_coroutine, ephemeral=False, **kwargs):
         """
         import inspect
         
+        # Resolve the response surface once; the fallback path reuses it
+        response = getattr(ctx, 'response', None)
+        is_interaction = response is not None and hasattr(response, 'send_message')
+        done = None
+        
         try:
             # If it's a coroutine, await it
             if inspect.iscoroutine(embed_coroutine):
@@ -36,10 +41,11 @@ async def send_safely(ctx, embed_coroutine, ephemeral=False, **kwargs):
                 embed = embed_coroutine
                 
             # Handle different context types
-            if hasattr(ctx, 'response') and hasattr(ctx.response, 'send_message'):
+            if is_interaction:
                 # It's an interaction
-                if not ctx.response.is_done():
-                    return await ctx.response.send_message(embed=embed, ephemeral=ephemeral, **kwargs)
+                done = response.is_done()
+                if not done:
+                    return await response.send_message(embed=embed, ephemeral=ephemeral, **kwargs)
                 else:
                     return await ctx.followup.send(embed=embed, ephemeral=ephemeral, **kwargs)
             else:
@@ -64,9 +70,12 @@ async def send_safely(ctx, embed_coroutine, ephemeral=False, **kwargs):
             fallback.set_footer(text="Please report this error to the bot developers")
             
             try:
-                if hasattr(ctx, 'response') and hasattr(ctx.response, 'send_message'):
-                    if not ctx.response.is_done():
-                        return await ctx.response.send_message(embed=fallback, ephemeral=True)
+                if is_interaction:
+                    # Only the initial send can have changed the response state
+                    if not done:
+                        done = response.is_done()
+                    if not done:
+                        return await response.send_message(embed=fallback, ephemeral=True)
                     else:
                         return await ctx.followup.send(embed=fallback, ephemeral=True)
                 else:
@@ -7,13 +7,14 @@ with compatibility across different versions of py-cord and discord.py.
 
 import logging
 import traceback
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Union, Callable, TypeVar, Awaitable
 
 import discord
 from discord.ext import commands
 
 from utils.command_imports import (
-    is_compatible_with_pycord_261,
     PYCORD_261,
     HAS_APP_COMMANDS
 )
@@ -23,6 +24,35 @@ logger = logging.getLogger(__name__)
 # Define a type for interaction or context
 InteractionOrCtx = Union[discord.Interaction, commands.Context]
 
+# Capability flags - resolved once at import time instead of per interaction
+HAS_RESPOND_METHOD = callable(getattr(discord.Interaction, "respond", None))
+HAS_EDIT_ORIGINAL_MESSAGE = callable(getattr(discord.Interaction, "edit_original_message", None))
+HAS_SEND_MESSAGE_METHOD = callable(getattr(discord.Interaction, "send_message", None))
+HAS_SEND_METHOD = callable(getattr(discord.Interaction, "send", None))
+HAS_DEFER_METHOD = callable(getattr(discord.Interaction, "defer", None))
+HAS_RESPONSE_DEFER = callable(getattr(discord.InteractionResponse, "defer", None))
+HAS_RESPONSE_IS_DONE = callable(getattr(discord.InteractionResponse, "is_done", None))
+HAS_RESPONSE_SEND_MESSAGE = hasattr(discord.InteractionResponse, "send_message")
+HAS_RESPONSE_SEND_MODAL = hasattr(discord.InteractionResponse, "send_modal")
+HAS_FOLLOWUP_SEND = hasattr(discord.Webhook, "send")
+HAS_FOLLOWUP_MESSAGE = hasattr(discord.Webhook, "message")
+
+# Response senders for this library, selected once from the flags above.
+# Each getter takes the interaction and returns the bound send coroutine.
+if PYCORD_261:
+    _get_initial_sender = attrgetter("response.send_message") if HAS_RESPONSE_SEND_MESSAGE else None
+    _get_followup_sender = attrgetter("followup.send") if HAS_FOLLOWUP_SEND else None
+else:
+    _get_initial_sender = attrgetter("respond") if HAS_RESPOND_METHOD else None
+    if HAS_EDIT_ORIGINAL_MESSAGE:
+        _get_followup_sender = attrgetter("edit_original_message")
+    elif HAS_SEND_MESSAGE_METHOD:
+        _get_followup_sender = attrgetter("send_message")
+    elif HAS_SEND_METHOD:
+        _get_followup_sender = attrgetter("send")
+    else:
+        _get_followup_sender = None
+
 async def safely_respond_to_interaction(
     interaction: discord.Interaction,
     content: Optional[str] = None,
@@ -66,11 +96,10 @@ async def safely_respond_to_interaction(
         is_responded = False
         
         # Check the interaction's response attribute based on library version
-        if is_compatible_with_pycord_261():
+        if PYCORD_261:
             # py-cord 2.6.1 uses interaction.response and has an is_done() method
-            if hasattr(interaction, 'response') and interaction.response:
-                if hasattr(interaction.response, 'is_done') and callable(interaction.response.is_done):
-                    is_responded = interaction.response.is_done()
+            if HAS_RESPONSE_IS_DONE and interaction.response:
+                is_responded = interaction.response.is_done()
         else:
             # Other libraries might use different attributes
             is_responded = getattr(interaction, "_responded", False)
@@ -100,70 +129,47 @@ async def safely_respond_to_interaction(
         
         # Handle the response based on whether it's already been responded to
         if not is_responded:
-            # First response - use the send_message method with library compatibility
-            if is_compatible_with_pycord_261():
-                # py-cord 2.6.1 uses interaction.response.send_message
-                if hasattr(interaction, 'response') and hasattr(interaction.response, 'send_message'):
-                    await interaction.response.send_message(**response_kwargs)
-                    
-                    # Get the message from followup if available
-                    if hasattr(interaction, 'followup') and hasattr(interaction.followup, 'message'):
-                        return interaction.followup.message
-                    
-                    # Otherwise, return None as we can't get the message object
-                    return None
-                else:
-                    logger.warning("Cannot find response.send_message on interaction")
-                    return None
-            else:
-                # Other libraries might use respond
-                if hasattr(interaction, 'respond') and callable(interaction.respond):
-                    return await interaction.respond(**response_kwargs)
-                else:
-                    logger.warning("Cannot find respond method on interaction")
-                    return None
+            # First response - use the sender selected for this library at import
+            if _get_initial_sender is None:
+                logger.warning("Cannot find an initial response method on interaction")
+                return None
+            
+            result = await _get_initial_sender(interaction)(**response_kwargs)
+            if PYCORD_261:
+                # py-cord 2.6.1's send_message doesn't return the message; get it
+                # from followup if available
+                return interaction.followup.message if HAS_FOLLOWUP_MESSAGE else None
+            return result
         else:
-            # Follow-up response - use followup/edit_original_message with library compatibility
-            if is_compatible_with_pycord_261():
-                # py-cord 2.6.1 uses interaction.followup.send for follow-ups
-                if hasattr(interaction, 'followup') and hasattr(interaction.followup, 'send'):
-                    return await interaction.followup.send(**response_kwargs)
-                else:
-                    logger.warning("Cannot find followup.send on interaction")
-                    
-                    # Try channel.send as a fallback
-                    if hasattr(interaction, 'channel') and interaction.channel:
-                        if hasattr(interaction.channel, 'send') and callable(interaction.channel.send):
-                            return await interaction.channel.send(**response_kwargs)
-                    
-                    return None
-            else:
-                # Other libraries might use send_message/edit_original_message
-                if hasattr(interaction, 'edit_original_message') and callable(interaction.edit_original_message):
-                    return await interaction.edit_original_message(**response_kwargs)
-                elif hasattr(interaction, 'send_message') and callable(interaction.send_message):
-                    return await interaction.send_message(**response_kwargs)
-                elif hasattr(interaction, 'send') and callable(interaction.send):
-                    return await interaction.send(**response_kwargs)
-                else:
-                    logger.warning("Cannot find appropriate follow-up method on interaction")
-                    return None
+            # Follow-up response - use the sender selected for this library at import
+            if _get_followup_sender is not None:
+                return await _get_followup_sender(interaction)(**response_kwargs)
+            
+            logger.warning("Cannot find appropriate follow-up method on interaction")
+            
+            # Try channel.send as a fallback on py-cord 2.6.1
+            if PYCORD_261:
+                channel = getattr(interaction, 'channel', None)
+                if channel and callable(getattr(channel, 'send', None)):
+                    return await channel.send(**response_kwargs)
+            
+            return None
     except Exception as e:
-        logger.error(f"Error responding to interaction: {e}")
+        logger.error("Error responding to interaction: %s", e)
         logger.error(traceback.format_exc())
         
         # Try to respond with a generic error message
         try:
-            if is_compatible_with_pycord_261():
+            if PYCORD_261:
                 # Check if we can send a followup
-                if hasattr(interaction, 'followup') and hasattr(interaction.followup, 'send'):
+                if HAS_FOLLOWUP_SEND:
                     await interaction.followup.send(
                         content="An error occurred while processing your request.",
                         ephemeral=True
                     )
             else:
                 # Try using send as a fallback
-                if hasattr(interaction, 'send') and callable(interaction.send):
+                if HAS_SEND_METHOD:
                     await interaction.send(
                         content="An error occurred while processing your request.",
                         ephemeral=True
@@ -192,16 +198,84 @@ async def get_interaction_user(interaction_or_ctx: InteractionOrCtx) -> Optional
             # For context, use author attribute
             return getattr(interaction_or_ctx, 'author', None)
         else:
-            logger.warning(f"Unknown interaction type: {type(interaction_or_ctx)}")
+            logger.warning("Unknown interaction type: %s", type(interaction_or_ctx))
             return None
     except Exception as e:
-        logger.error(f"Error getting interaction user: {e}")
+        logger.error("Error getting interaction user: %s", e)
         return None
 
+@dataclass(slots=True)
+class ModalFieldConfig:
+    """Definition of a single modal input field"""
+    
+    label: str = "Input"
+    placeholder: str = ""
+    value: str = ""
+    required: bool = True
+    style: Any = None
+    custom_id: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModalFieldConfig":
+        """
+        Build a field config from a dict definition, ignoring unknown keys
+        
+        Args:
+            data: Field definition dict
+            
+        Returns:
+            ModalFieldConfig: The field config
+        """
+        return cls(**{name: data[name] for name in _MODAL_FIELD_NAMES if name in data})
+
+_MODAL_FIELD_NAMES = tuple(f.name for f in fields(ModalFieldConfig))
+
+# Modal classes and the default input style, resolved once at import
+try:
+    from discord.ui import Modal as _Modal, InputText as _InputText
+except ImportError:
+    _Modal = None
+    _InputText = None
+
+_DEFAULT_INPUT_STYLE = getattr(getattr(discord, "InputTextStyle", None), "short", None)
+
+if _Modal is not None:
+    class _DynamicModal(_Modal):
+        """Modal built from a list of input field definitions"""
+        
+        def __init__(self, title, custom_id, input_fields):
+            super().__init__(title=title, custom_id=custom_id)
+            
+            # Add each input field
+            for field in input_fields:
+                if not isinstance(field, ModalFieldConfig):
+                    field = ModalFieldConfig.from_dict(field)
+                style = _DEFAULT_INPUT_STYLE if field.style is None else field.style
+                item_kwargs = {
+                    "label": field.label,
+                    "placeholder": field.placeholder,
+                    "value": field.value,
+                    "required": field.required,
+                    "custom_id": field.custom_id or f"input_{len(self.children)}"
+                }
+                if style is not None:
+                    item_kwargs["style"] = style
+                self.add_item(_InputText(**item_kwargs))
+        
+        async def callback(self, interaction):
+            # Default callback - for custom handling, caller should add their own
+            results = {}
+            for child in self.children:
+                results[child.custom_id] = child.value
+            
+            await interaction.response.send_message(f"Modal submitted: {results}", ephemeral=True)
+else:
+    _DynamicModal = None
+
 async def send_modal(
     interaction: discord.Interaction,
     title: str,
-    input_fields: List[Dict[str, Any]],
+    input_fields: List[Union[Dict[str, Any], ModalFieldConfig]],
     custom_id: Optional[str] = None
 ) -> bool:
     """
@@ -210,7 +284,7 @@ async def send_modal(
     Args:
         interaction: The interaction to respond with a modal
         title: The title of the modal
-        input_fields: List of input field definitions
+        input_fields: List of input field definitions, as dicts or ModalFieldConfig
         custom_id: Optional custom ID for the modal
         
     Returns:
@@ -221,55 +295,27 @@ async def send_modal(
         if not custom_id:
             custom_id = f"modal_{title.lower().replace(' ', '_')}"
             
-        if is_compatible_with_pycord_261():
+        if PYCORD_261:
             # py-cord 2.6.1 uses Modal class
-            # Check what version of Modal class we have
-            try:
-                # Import Modal and InputText classes
-                from discord.ui import Modal, InputText
-                
-                # Create a new Modal subclass
-                class DynamicModal(Modal):
-                    def __init__(self, title, custom_id, input_fields):
-                        super().__init__(title=title, custom_id=custom_id)
-                        
-                        # Add each input field
-                        for field in input_fields:
-                            self.add_item(InputText(
-                                label=field.get("label", "Input"),
-                                placeholder=field.get("placeholder", ""),
-                                value=field.get("value", ""),
-                                required=field.get("required", True),
-                                style=field.get("style", InputText.short),
-                                custom_id=field.get("custom_id", f"input_{len(self.children)}")
-                            ))
-                    
-                    async def callback(self, interaction):
-                        # Default callback - for custom handling, caller should add their own
-                        results = {}
-                        for child in self.children:
-                            results[child.custom_id] = child.value
-                        
-                        await interaction.response.send_message(f"Modal submitted: {results}", ephemeral=True)
-                
-                # Create the modal instance
-                modal = DynamicModal(title=title, custom_id=custom_id, input_fields=input_fields)
-                
-                # Send the modal
-                if hasattr(interaction, 'response') and hasattr(interaction.response, 'send_modal'):
-                    await interaction.response.send_modal(modal)
-                    return True
-                else:
-                    logger.warning("Cannot find response.send_modal on interaction")
-                    return False
-            except ImportError as e:
-                logger.error(f"Error importing Modal/InputText: {e}")
+            if _DynamicModal is None:
+                logger.error("Modal/InputText classes are not available")
+                return False
+            
+            # Create the modal instance
+            modal = _DynamicModal(title=title, custom_id=custom_id, input_fields=input_fields)
+            
+            # Send the modal
+            if HAS_RESPONSE_SEND_MODAL:
+                await interaction.response.send_modal(modal)
+                return True
+            else:
+                logger.warning("Cannot find response.send_modal on interaction")
                 return False
         else:
             # Other libraries might have different methods
             logger.warning("Modal support for non-py-cord libraries not implemented")
             return False
     except Exception as e:
-        logger.error(f"Error sending modal: {e}")
+        logger.error("Error sending modal: %s", e)
         logger.error(traceback.format_exc())
         return False
\ No newline at end of file
@@ -7,7 +7,17 @@ error handling, type checking, and consistent patterns.
 
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional, Union, TypeVar, Generic, cast
+import copy
+import functools
+import sys
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar, Generic, cast
+
+import bson
+from bson import json_util
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +25,66 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 D = TypeVar('D', bound=Dict[str, Any])
 
+# Sentinel distinguishing a missing key from a stored None
+_MISSING = object()
+
+try:
+    import xxhash
+    
+    def _digest(data: bytes) -> int:
+        """Hash encoded query bytes down to a compact cache key"""
+        return xxhash.xxh3_64_intdigest(data)
+except ImportError:
+    def _digest(data: bytes) -> bytes:
+        """Use encoded query bytes directly as the cache key"""
+        return data
+
+class TokenBucket:
+    """Rate limiter allowing ``rate`` events per second with bursts up to ``burst``"""
+    
+    __slots__ = ("rate", "burst", "_tokens", "_updated")
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+    
+    def allow(self) -> bool:
+        """Consume a token if one is available"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+# Caps database error logging during outages; dropped records are counted instead
+_error_sampler = TokenBucket(rate=10, burst=20)
+_suppressed_errors = 0
+
+def _log_error(message: str, *args: Any) -> None:
+    """Log a database error unless the error sampler is exhausted"""
+    global _suppressed_errors
+    if not _error_sampler.allow():
+        _suppressed_errors += 1
+        return
+    if _suppressed_errors:
+        logger.error("Suppressed %d database error log records", _suppressed_errors)
+        _suppressed_errors = 0
+    logger.error(message, *args)
+
+# Upper bound for the batch size derived from a find limit
+MAX_AUTO_BATCH_SIZE = 1000
+
+# Short-lived read cache for count/find results, keyed by query fingerprint
+QUERY_CACHE_MAX_ENTRIES = 10_000
+_query_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+# Per-collection generation, part of every cache key; bumping it after a write
+# orphans that collection's entries, which then age out of the LRU
+_cache_generations: Dict[str, int] = {}
+
 # For class-based pattern
 class SafeDocument:
     """Wrapper for MongoDB documents with safe access methods"""
@@ -53,20 +123,44 @@ def safe_get(data: Optional[Dict[str, Any]], key: str, default: T = None) -> Opt
     if data is None:
         return default
     
+    # Plain dicts can't raise from .get, so skip the exception handling
+    if type(data) is dict:
+        return data.get(key, default)
+    
     try:
         return data.get(key, default)
     except (AttributeError, KeyError):
-        logger.debug(f"Failed to access key '{key}' in dictionary")
+        logger.debug("Failed to access key %r in dictionary", key)
         return default
 
-def safe_get_nested(data: Optional[Dict[str, Any]], path: str, default: Any = None, 
-                    delimiter: str = '.') -> Any:
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str, delimiter: str = '.') -> Tuple[str, ...]:
+    """Split a dot-notation path into a cached tuple of interned keys"""
+    # Interned keys let dict lookups against interned document keys match by identity
+    return tuple(sys.intern(key) for key in path.split(delimiter))
+
+def compile_path(path: str, delimiter: str = '.') -> Tuple[str, ...]:
+    """
+    Precompile a dot-notation path for repeated use with safe_get_nested
+    
+    Args:
+        path: Dot-notation path (e.g., 'user.profile.name')
+        delimiter: Delimiter to use for path segments (default: '.')
+        
+    Returns:
+        Tuple of interned path segments that can be passed as the path argument
+    """
+    return _split_path(path, delimiter)
+
+def safe_get_nested(data: Optional[Dict[str, Any]], path: Union[str, Tuple[str, ...]],
+                    default: Any = None, delimiter: str = '.') -> Any:
     """
     Safely get a nested value from a dictionary using a dot-notation path
     
     Args:
         data: Dictionary to retrieve value from
-        path: Dot-notation path to the value (e.g., 'user.profile.name')
+        path: Dot-notation path to the value (e.g., 'user.profile.name'),
+            or a tuple of keys from compile_path
         default: Default value to return if path doesn't exist
         delimiter: Delimiter to use for path segments (default: '.')
         
@@ -76,22 +170,18 @@ def safe_get_nested(data: Optional[Dict[str, Any]], path: str, default: Any = No
     if data is None:
         return default
     
-    keys = path.split(delimiter)
+    keys = path if type(path) is tuple else _split_path(path, delimiter)
     result = data
     
-    try:
-        for key in keys:
-            if not isinstance(result, dict):
-                return default
-            
-            result = result.get(key)
-            if result is None:
-                return default
+    for key in keys:
+        if type(result) is not dict and not isinstance(result, dict):
+            return default
         
-        return result
-    except (AttributeError, KeyError):
-        logger.debug(f"Failed to access nested path '{path}' in dictionary")
-        return default
+        result = result.get(key, _MISSING)
+        if result is _MISSING or result is None:
+            return default
+    
+    return result
 
 def is_db_available(db):
     """
@@ -110,16 +200,136 @@ def is_db_available(db):
         # Lightweight check that doesn't require a server round-trip
         return hasattr(db, 'client') and hasattr(db, 'name')
     except (AttributeError, Exception) as e:
-        logger.error(f"Database availability check failed: {e}")
+        _log_error("Database availability check failed: %s", e)
         return False
 
-async def get_document_safely(collection, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def _batch_key(doc_id: Any) -> Tuple[bool, Any]:
+    """Key an ``_id`` so values equal in Python but not on the server stay apart"""
+    # True == 1 in Python, but the server never matches a bool against a number
+    return (type(doc_id) is bool, doc_id)
+
+class BatchedFinder:
+    """
+    Coalesces concurrent ``_id`` lookups on one collection into a single ``$in`` query
+    
+    Lookups enqueued within ``window_ms`` of the first one share a single round-trip.
+    With the default window of 0 the batch is flushed on the next event loop
+    iteration, so only lookups issued together (e.g. via asyncio.gather) are merged.
+    """
+    
+    # Keyed by (event loop, client, collection name) so batches never mix
+    # collections from different clients or loops
+    _instances: Dict[Tuple[int, int, str], "BatchedFinder"] = {}
+    # Strong references to in-flight lookups so they aren't garbage collected
+    _tasks: set = set()
+    
+    def __init__(self, collection, window_ms: float = 0, key: Optional[Tuple[int, int, str]] = None):
+        self.collection = collection
+        self.window = window_ms / 1000
+        self.key = key
+        self._pending: deque = deque()
+        self._handle: Optional[asyncio.Handle] = None
+    
+    @staticmethod
+    def _instance_key(collection) -> Tuple[int, int, str]:
+        """Build the registry key for a collection on the running loop"""
+        client = getattr(getattr(collection, "database", None), "client", None)
+        return (id(asyncio.get_running_loop()), id(client), collection.full_name)
+    
+    @classmethod
+    def for_collection(cls, collection) -> "BatchedFinder":
+        """Get the batcher currently collecting lookups for a collection"""
+        key = cls._instance_key(collection)
+        finder = cls._instances.get(key)
+        if finder is None:
+            finder = cls._instances[key] = cls(collection, key=key)
+        return finder
+    
+    def get(self, doc_id: Any) -> "asyncio.Future[Optional[Dict[str, Any]]]":
+        """
+        Queue a lookup by ``_id``
+        
+        Args:
+            doc_id: Value of the ``_id`` field to look up
+            
+        Returns:
+            Future resolving to the document or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((doc_id, future))
+        if self._handle is None:
+            if self.window > 0:
+                self._handle = loop.call_later(self.window, self._flush)
+            else:
+                self._handle = loop.call_soon(self._flush)
+        return future
+    
+    def _flush(self) -> None:
+        self._handle = None
+        pending, self._pending = self._pending, deque()
+        # Later lookups start a fresh batch
+        if BatchedFinder._instances.get(self.key) is self:
+            del BatchedFinder._instances[self.key]
+        task = asyncio.ensure_future(self._run(pending))
+        BatchedFinder._tasks.add(task)
+        task.add_done_callback(BatchedFinder._tasks.discard)
+    
+    async def _run(self, pending: deque) -> None:
+        ids = list({_batch_key(doc_id): doc_id for doc_id, _ in pending}.values())
+        try:
+            docs = await self.collection.find({"_id": {"$in": ids}}).to_list(length=None)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        by_id = {}
+        for doc in docs:
+            doc_id = doc.get("_id")
+            by_id[_batch_key(doc_id)] = doc
+        delivered = set()
+        for doc_id, future in pending:
+            if future.done():
+                continue
+            key = _batch_key(doc_id)
+            doc = by_id.get(key)
+            # Waiters sharing an _id each get their own independent copy
+            if doc is not None and key in delivered:
+                doc = copy.deepcopy(doc)
+            delivered.add(key)
+            future.set_result(doc)
+
+def _is_batchable_id_query(collection, query: Dict[str, Any]) -> bool:
+    """Check whether a query is a plain ``{"_id": value}`` lookup that can be batched"""
+    if len(query) != 1 or "_id" not in query:
+        return False
+    value = query["_id"]
+    if type(value) in (dict, list):
+        return False
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return isinstance(getattr(collection, "full_name", None), str)
+
+async def get_document_safely(collection, query: Dict[str, Any],
+                              projection: Optional[Dict[str, Any]] = None,
+                              hint=None,
+                              negative_ttl: Optional[float] = None,
+                              batched: bool = False) -> Optional[Dict[str, Any]]:
     """
     Safely retrieve a document from a MongoDB collection with error handling
     
     Args:
         collection: MongoDB collection to query
         query: Query dictionary to find the document
+        projection: Fields to return (e.g. {"_id": 1} for an index-covered read)
+        hint: Index to use for the query
+        negative_ttl: Seconds to remember that the query matched nothing (no caching if None)
+        batched: Merge a plain ``{"_id": value}`` lookup with concurrent ones on the
+            same collection into a single ``$in`` query
         
     Returns:
         Document dict or None if not found or error occurs
@@ -128,9 +338,27 @@ async def get_document_safely(collection, query: Dict[str, Any]) -> Optional[Dic
         return None
     
     try:
-        return await collection.find_one(query)
+        miss_key = None
+        if negative_ttl:
+            miss_key = _query_fingerprint(collection, 'miss', query, projection=projection)
+            if _query_cache_get(miss_key) is not _MISSING:
+                return None
+        
+        if projection is None and hint is None:
+            if batched and _is_batchable_id_query(collection, query):
+                document = await BatchedFinder.for_collection(collection).get(query["_id"])
+            else:
+                document = await collection.find_one(query)
+        elif hint is None:
+            document = await collection.find_one(query, projection)
+        else:
+            document = await collection.find_one(query, projection, hint=hint)
+        
+        if document is None and miss_key is not None:
+            _query_cache_put(miss_key, True, negative_ttl)
+        return document
     except Exception as e:
-        logger.error(f"Error retrieving document: {e}")
+        _log_error("Error retrieving document: %s", e)
         return None
 
 def document_exists(document: Optional[Dict[str, Any]]) -> bool:
@@ -138,15 +366,106 @@ def document_exists(document: Optional[Dict[str, Any]]) -> bool:
     Safely check if a document exists and is not empty
     
     Args:
-        document: Document to check
+        document: Document to check (dict-like or None)
         
     Returns:
         bool: True if document exists and is not empty, False otherwise
     """
-    return document is not None and len(document) > 0
+    # Truthiness covers both None and empty mappings without a len() call
+    return bool(document)
+
+class BulkWriter:
+    """
+    Queues update_one operations per collection and flushes them as one bulk_write
+    
+    A batch is flushed when it reaches ``max_batch`` operations or ``flush_interval``
+    seconds after its first operation, whichever comes first. Writes are unordered
+    so the server can apply them set-wise.
+    """
+    
+    _instance: Optional["BulkWriter"] = None
+    
+    def __init__(self, max_batch: int = 500, flush_interval: float = 0.005):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Tuple[Any, List[Tuple[UpdateOne, asyncio.Future]]]] = {}
+        self._handles: Dict[str, asyncio.TimerHandle] = {}
+        # Strong references to in-flight writes so they aren't garbage collected
+        self._tasks: set = set()
+    
+    @classmethod
+    def instance(cls) -> "BulkWriter":
+        """Get the shared BulkWriter"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def add(self, collection, query: Dict[str, Any], update: Dict[str, Any],
+            upsert: bool = False) -> "asyncio.Future[bool]":
+        """
+        Queue an update for the next bulk write on the collection
+        
+        Args:
+            collection: MongoDB collection to update
+            query: Query to find the document to update
+            update: Update operation to apply
+            upsert: Whether to insert if document doesn't exist
+            
+        Returns:
+            Future resolving to True once written, or raising the operation's write error
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = collection.full_name
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = self._pending[key] = (collection, [])
+        entry[1].append((UpdateOne(query, update, upsert=upsert), future))
+        
+        if len(entry[1]) >= self.max_batch:
+            self._flush(key)
+        elif key not in self._handles:
+            self._handles[key] = loop.call_later(self.flush_interval, self._flush, key)
+        return future
+    
+    def _flush(self, key: str) -> None:
+        handle = self._handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        entry = self._pending.pop(key, None)
+        if entry:
+            task = asyncio.ensure_future(self._write(*entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _write(self, collection, batch: List[Tuple[UpdateOne, asyncio.Future]]) -> None:
+        try:
+            result = await collection.bulk_write([op for op, _ in batch], ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            # Only now are the writes visible, so drop reads cached meanwhile
+            invalidate_query_cache(collection)
+        
+        errors = {error["index"]: error for error in details.get("writeErrors", ())}
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            error = errors.get(index)
+            if error is None:
+                future.set_result(True)
+            else:
+                future.set_exception(OperationFailure(error.get("errmsg"), error.get("code"), error))
 
 async def safely_update_document(collection, query: Dict[str, Any], 
-                                update: Dict[str, Any], upsert: bool = False) -> bool:
+                                update: Dict[str, Any], upsert: bool = False,
+                                batched: bool = False) -> bool:
     """
     Safely update a document in a MongoDB collection with error handling
     
@@ -155,6 +474,9 @@ async def safely_update_document(collection, query: Dict[str, Any],
         query: Query to find the document to update
         update: Update operation to apply
         upsert: Whether to insert if document doesn't exist
+        batched: Queue the update on the shared BulkWriter instead of issuing it
+            directly. Batched updates report success when the write produced no
+            error, even if no document was modified.
         
     Returns:
         bool: True if update was successful, False otherwise
@@ -163,21 +485,85 @@ async def safely_update_document(collection, query: Dict[str, Any],
         return False
     
     try:
-        result = await collection.update_one(query, update, upsert=upsert)
+        if batched:
+            return await BulkWriter.instance().add(collection, query, update, upsert)
+        
+        try:
+            result = await collection.update_one(query, update, upsert=upsert)
+        finally:
+            invalidate_query_cache(collection)
         # Check if acknowledged and at least one document was modified
         return result.acknowledged and (result.modified_count > 0 or 
                                         (upsert and result.upserted_id is not None))
     except Exception as e:
-        logger.error(f"Error updating document: {e}")
+        _log_error("Error updating document: %s", e)
         return False
 
-async def count_documents_safely(collection, query: Dict[str, Any]) -> int:
+def _query_fingerprint(collection, kind: str, query: Dict[str, Any],
+                       limit: int = 0, sort=None, projection=None) -> Tuple[Any, ...]:
+    """Build a deterministic cache key for a read against a collection"""
+    try:
+        query_key = _digest(bson.encode(query))
+    except Exception:
+        # Not BSON-encodable as-is (e.g. non-string keys); fall back to JSON
+        query_key = json_util.dumps(query, sort_keys=True)
+    full_name = collection.full_name
+    return (
+        full_name,
+        _cache_generations.get(full_name, 0),
+        kind,
+        limit,
+        json_util.dumps(sort),
+        json_util.dumps(projection, sort_keys=True),
+        query_key,
+    )
+
+def _query_cache_get(key: Tuple[Any, ...]) -> Any:
+    """Get a cached read result, or _MISSING if absent or expired"""
+    entry = _query_cache.get(key)
+    if entry is None:
+        return _MISSING
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del _query_cache[key]
+        return _MISSING
+    _query_cache.move_to_end(key)
+    return copy.deepcopy(value)
+
+def _query_cache_put(key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+    """Store a read result, evicting the least recently used entries when full"""
+    _query_cache[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+    _query_cache.move_to_end(key)
+    while len(_query_cache) > QUERY_CACHE_MAX_ENTRIES:
+        _query_cache.popitem(last=False)
+
+def invalidate_query_cache(collection=None) -> None:
+    """
+    Drop cached read results
+    
+    Call this after a write completes, so reads that overlapped the write and
+    cached the old result are discarded too.
+    
+    Args:
+        collection: Only drop results for this collection; drops everything if None
+    """
+    if collection is None:
+        _query_cache.clear()
+        return
+    
+    full_name = getattr(collection, 'full_name', None)
+    if full_name is not None:
+        _cache_generations[full_name] = _cache_generations.get(full_name, 0) + 1
+
+async def count_documents_safely(collection, query: Dict[str, Any],
+                                 cache_ttl: Optional[float] = None) -> int:
     """
     Safely count documents in a MongoDB collection with error handling
     
     Args:
         collection: MongoDB collection to query
         query: Query to count matching documents
+        cache_ttl: Seconds to reuse the count for identical queries (no caching if None)
         
     Returns:
         int: Count of matching documents or 0 if error occurs
@@ -186,13 +572,44 @@ async def count_documents_safely(collection, query: Dict[str, Any]) -> int:
         return 0
     
     try:
-        return await collection.count_documents(query)
+        if not cache_ttl:
+            return await collection.count_documents(query)
+        
+        key = _query_fingerprint(collection, 'count', query)
+        count = _query_cache_get(key)
+        if count is _MISSING:
+            count = await collection.count_documents(query)
+            _query_cache_put(key, count, cache_ttl)
+        return count
     except Exception as e:
-        logger.error(f"Error counting documents: {e}")
+        _log_error("Error counting documents: %s", e)
         return 0
 
+def _build_find_cursor(collection, query: Dict[str, Any], limit: int = 0, sort=None,
+                       projection: Optional[Dict[str, Any]] = None,
+                       batch_size: Optional[int] = None):
+    """Create a find cursor with the optional sort, limit, projection and batch size applied"""
+    cursor = collection.find(query, projection)
+    
+    if sort is not None:
+        cursor = cursor.sort(sort)
+    
+    if limit > 0:
+        cursor = cursor.limit(limit)
+        # Fetch a known-size result in as few getMore round-trips as possible
+        if batch_size is None:
+            batch_size = min(limit, MAX_AUTO_BATCH_SIZE)
+    
+    if batch_size:
+        cursor = cursor.batch_size(batch_size)
+    
+    return cursor
+
 async def find_documents_safely(collection, query: Dict[str, Any], 
-                              limit: int = 0, sort=None) -> List[Dict[str, Any]]:
+                              limit: int = 0, sort=None,
+                              cache_ttl: Optional[float] = None,
+                              projection: Optional[Dict[str, Any]] = None,
+                              batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Safely find documents in a MongoDB collection with error handling
     
@@ -201,6 +618,11 @@ async def find_documents_safely(collection, query: Dict[str, Any],
         query: Query to find matching documents
         limit: Maximum number of documents to return (0 for no limit)
         sort: Sort specification
+        cache_ttl: Seconds to reuse the results for identical queries (no caching if None)
+        projection: Fields to return, passed through to the driver
+        batch_size: Documents per server round-trip; defaults to min(limit, 1000)
+            when a limit is set. For documents of 1KB or less use 1000; for larger
+            ones use max(101, 16_000_000 // average document size).
         
     Returns:
         List of matching documents or empty list if error occurs
@@ -209,17 +631,20 @@ async def find_documents_safely(collection, query: Dict[str, Any],
         return []
     
     try:
-        cursor = collection.find(query)
-        
-        if sort is not None:
-            cursor = cursor.sort(sort)
-        
-        if limit > 0:
-            cursor = cursor.limit(limit)
-        
-        return await cursor.to_list(length=None)
+        key = None
+        if cache_ttl:
+            key = _query_fingerprint(collection, 'find', query, limit, sort, projection)
+            docs = _query_cache_get(key)
+            if docs is not _MISSING:
+                return docs
+        
+        cursor = _build_find_cursor(collection, query, limit, sort, projection, batch_size)
+        docs = await cursor.to_list(length=limit or None)
+        if key is not None:
+            _query_cache_put(key, docs, cache_ttl)
+        return docs
     except Exception as e:
-        logger.error(f"Error finding documents: {e}")
+        _log_error("Error finding documents: %s", e)
         return []
 
 # Enhanced safe database access functions
@@ -264,7 +689,7 @@ async def safe_get_db(db_instance, db_name: Optional[str] = None):
         logger.warning("Could not determine database from instance")
         return db_instance  # Assume it's already a database
     except Exception as e:
-        logger.error(f"Error accessing database: {e}")
+        _log_error("Error accessing database: %s", e)
         return None
 
 async def safe_get_collection(db, collection_name: str):
@@ -279,7 +704,7 @@ async def safe_get_collection(db, collection_name: str):
         Collection instance or None if error occurs
     """
     if db is None:
-        logger.warning(f"Database is None when accessing collection {collection_name}")
+        logger.warning("Database is None when accessing collection %s", collection_name)
         return None
         
     if not collection_name:
@@ -293,9 +718,9 @@ async def safe_get_collection(db, collection_name: str):
             try:
                 default_db_name = db.get_default_database().name
                 db = db[default_db_name]
-                logger.info(f"Using default database: {default_db_name}")
+                logger.info("Using default database: %s", default_db_name)
             except Exception as e:
-                logger.error(f"Error getting default database: {e}")
+                _log_error("Error getting default database: %s", e)
                 # Try a fallback name
                 db = db.get_database('tower_temptation')
                 logger.info("Using fallback database: tower_temptation")
@@ -303,7 +728,7 @@ async def safe_get_collection(db, collection_name: str):
         # Now get the collection
         return db[collection_name]
     except Exception as e:
-        logger.error(f"Error accessing collection {collection_name}: {e}")
+        _log_error("Error accessing collection %s: %s", collection_name, e)
         return None
 
 async def safe_find_one(collection, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -350,12 +775,50 @@ async def safe_insert_one(collection, document: Dict[str, Any]) -> Optional[str]
         return None
     
     try:
-        result = await collection.insert_one(document)
+        try:
+            result = await collection.insert_one(document)
+        finally:
+            invalidate_query_cache(collection)
         return str(result.inserted_id) if result.inserted_id else None
+    except DuplicateKeyError as e:
+        _log_error("Duplicate key inserting document: %s", e)
+        return None
     except Exception as e:
-        logger.error(f"Error inserting document: {e}")
+        _log_error("Error inserting document: %s", e)
         return None
 
+async def safe_insert_many(collection, documents: List[Dict[str, Any]]) -> int:
+    """
+    Safely insert several new documents with error handling
+    
+    The insert is unordered, so the server applies every document it can and
+    documents whose key already exists are counted as failures.
+    
+    Args:
+        collection: MongoDB collection
+        documents: Documents to insert
+        
+    Returns:
+        Number of documents inserted
+    """
+    if collection is None or not documents:
+        return 0
+    
+    try:
+        try:
+            result = await collection.insert_many(documents, ordered=False)
+        finally:
+            invalidate_query_cache(collection)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        details = e.details
+        _log_error("Failed to insert %s of %s documents",
+                   len(details.get("writeErrors", ())), len(documents))
+        return details.get("nInserted", 0)
+    except Exception as e:
+        _log_error("Error inserting documents: %s", e)
+        return 0
+
 async def safe_count_documents(collection, query: Dict[str, Any]) -> int:
     """
     Safely count documents with error handling
@@ -406,7 +869,7 @@ def safe_document_to_dict(document: Any) -> Dict[str, Any]:
     if hasattr(document, '__dict__'):
         return document.__dict__
     
-    logger.warning(f"Unable to convert document of type {type(document)} to dict")
+    logger.warning("Unable to convert document of type %s to dict", type(document))
     return {}
 
 def has_field(document: Optional[Dict[str, Any]], field: str) -> bool:
@@ -442,18 +905,23 @@ def get_field_with_type_check(data: Optional[Dict[str, Any]], key: str,
     if data is None:
         return default
     
-    try:
+    if type(data) is dict:
         value = data.get(key)
-        
-        # If value doesn't exist, return default
-        if value is None:
-            return default
-        
-        # If value is not of expected type, log warning and return default
-        if not isinstance(value, expected_type):
-            logger.warning(f"Field '{key}' has unexpected type: {type(value)}, expected: {expected_type}")
+    else:
+        try:
+            value = data.get(key)
+        except Exception:
             return default
-        
-        return value
-    except Exception:
-        return default
\ No newline at end of file
+    
+    # If value doesn't exist, return default
+    if value is None:
+        return default
+    
+    # Exact type match is the common case; only fall back to isinstance for subclasses
+    if type(value) is not expected_type and not isinstance(value, expected_type):
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Field %r has unexpected type: %s, expected: %s",
+                           key, type(value).__name__, expected_type)
+        return default
+    
+    return value
\ No newline at end of file